@@ -1,13 +1,19 @@
 """Entry point for Railway deployment.
 
-This script adds the src directory to Python's path and runs the remote server.
+Runs the remote server. When the package is installed (pip install ".[remote]"),
+the `linkup-company-research-remote` console script does the same without this file;
+otherwise the src directory is added to Python's path once.
 """
 
-import sys
+import importlib.util
 import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+# Only fall back to the src checkout when the package isn't importable already
+if importlib.util.find_spec("linkup_company_research") is None and SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 # Now import and run the remote server
 from linkup_company_research.remote import main
@@ -0,0 +1,112 @@
+"""Response cache for Linkup Company Research MCP.
+
+Every tool call triggers a full Linkup search, even when the same company was
+researched minutes ago. Tool responses are cached in-process, keyed by tool name,
+the caller's API key, normalized company name and the remaining tool arguments.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Time-to-live per tool (seconds)
+TTL_DEFAULT = 86400  # 24 hours - company profile data changes slowly
+TTL_NEWS = 3600      # 1 hour - recent activity goes stale quickly
+
+# Maximum number of cached responses kept in memory
+CACHE_MAX_ENTRIES = 1024
+
+# Set LINKUP_DISABLE_CACHE=1 to send every tool call to Linkup
+CACHE_DISABLED = os.environ.get("LINKUP_DISABLE_CACHE", "").lower() in ("1", "true", "yes")
+
+# Legal suffixes stripped from company names so "Acme Inc." and "acme" share an entry
+_LEGAL_SUFFIX_RE = re.compile(
+    r"[\s,]+(inc|incorporated|corp|corporation|co|company|llc|ltd|limited|plc|gmbh|ag|sa|sas|bv|nv)\.?$"
+)
+
+
+def normalize_company_name(company_name: str) -> str:
+    """Normalize a company name for cache lookups (lowercase, no legal suffix)."""
+    name = " ".join(company_name.lower().split())
+    return _LEGAL_SUFFIX_RE.sub("", name) or name
+
+
+class ExactCache:
+    """In-memory LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared cache for all tools
+response_cache = ExactCache()
+
+
+def cached(tool: str, scope: Callable[[], str], ttl: float = TTL_DEFAULT) -> Callable:
+    """Cache an async tool's response keyed by (tool, scope, company, arguments).
+
+    scope returns the caller's credential (the Linkup API key). Responses are
+    only shared between calls made with the same one, so a caller never gets an
+    answer another key paid for; only a hash of it is kept in the key.
+
+    The wrapped function keeps its signature so FastMCP still derives the
+    same tool schema from it. Exceptions are never cached. When the cache is
+    disabled the function is returned unwrapped.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if CACHE_DISABLED:
+            return func
+
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            company = normalize_company_name(arguments.pop("company_name", ""))
+            caller = hashlib.sha256(scope().encode()).digest()
+            key = (tool, caller, company, tuple(sorted(arguments.items())))
+
+            result = response_cache.get(key)
+            if result is None:
+                result = await func(*args, **kwargs)
+                response_cache.set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
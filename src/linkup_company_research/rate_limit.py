@@ -0,0 +1,212 @@
+"""Rate limiting for the free tier of the remote server.
+
+Limits are enforced per client IP: a burst/QPS limit from a pluggable algorithm
+plus a rolling daily request cap. State is kept in memory, bounded to the most
+recently seen clients, or in Redis so the counters survive server restarts.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Length of the daily request window (seconds)
+DAILY_WINDOW_SECONDS = 86400
+
+
+def _qps_error(qps: int) -> str:
+    return f"Rate limit exceeded: {qps} requests per second. Add your own API key to remove limits."
+
+
+def _daily_error(daily: int) -> str:
+    return f"Daily limit exceeded: {daily} requests per day. Add your own API key to remove limits."
+
+
+class RateLimiter(ABC):
+    """In-memory per-key rate limiter with a QPS limit and a daily cap.
+
+    Subclasses implement the QPS algorithm in _acquire(); the daily window and
+    LRU-bounded state are shared. check() never awaits internally, so it runs
+    atomically on the event loop and needs no lock.
+    """
+
+    def __init__(self, qps: int, daily: int, max_clients: int):
+        self.qps = qps
+        self.daily = daily
+        self.max_clients = max_clients
+        # key -> (algorithm state, daily_count, daily_window_start)
+        self._clients: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+
+    @abstractmethod
+    def _acquire(self, state: Optional[Any], now: float) -> tuple[bool, Any]:
+        """Try to admit one request. Returns (allowed, state after admitting it)."""
+
+    async def check(self, key: str) -> tuple[bool, str]:
+        """Check if key is within rate limits. Returns (allowed, error_message)."""
+        now = time.monotonic()
+
+        state, daily_count, daily_start = self._clients.get(key) or (None, 0, now)
+        # Start a fresh daily window 24 hours after the previous one began
+        if now - daily_start > DAILY_WINDOW_SECONDS:
+            daily_count, daily_start = 0, now
+
+        allowed, admitted_state = self._acquire(state, now)
+        if not allowed:
+            error = _qps_error(self.qps)
+        elif daily_count >= self.daily:
+            error = _daily_error(self.daily)
+        else:
+            # Record this request
+            state = admitted_state
+            daily_count += 1
+            error = ""
+
+        self._clients[key] = (state, daily_count, daily_start)
+        self._clients.move_to_end(key)
+        if len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+
+        return not error, error
+
+    async def close(self) -> None:
+        """Release any external resources (nothing to do for in-memory state)."""
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket holding `qps` tokens, refilled at `qps` tokens per second."""
+
+    def _acquire(self, state: Optional[tuple[float, float]], now: float) -> tuple[bool, tuple[float, float]]:
+        if state is None:
+            tokens = float(self.qps)
+        else:
+            tokens, last_refill = state
+            # Refill the bucket for the time elapsed since the last request
+            tokens = min(self.qps, tokens + (now - last_refill) * self.qps)
+        if tokens < 1:
+            return False, state
+        return True, (tokens - 1, now)
+
+
+class GCRARateLimiter(RateLimiter):
+    """Generic Cell Rate Algorithm: one theoretical arrival time (TAT) per key.
+
+    Equivalent to a leaky bucket that admits bursts of `qps` requests and a
+    sustained rate of `qps` per second, with a single float of state.
+    """
+
+    def __init__(self, qps: int, daily: int, max_clients: int):
+        super().__init__(qps, daily, max_clients)
+        self._emission_interval = 1.0 / qps
+        self._burst_tolerance = self._emission_interval * (qps - 1)
+
+    def _acquire(self, state: Optional[float], now: float) -> tuple[bool, float]:
+        tat = now if state is None else max(state, now)
+        if tat - now > self._burst_tolerance:
+            return False, state
+        return True, tat + self._emission_interval
+
+
+# Token bucket plus daily cap in one atomic step. Uses the Redis server clock so
+# every process refills the bucket the same way. Returns 0 (allowed), 1 (QPS
+# limit) or 2 (daily limit).
+REDIS_RATE_LIMIT_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local daily = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "last_refill", "daily_count", "daily_start")
+local tokens = tonumber(state[1]) or rate
+local last_refill = tonumber(state[2]) or now
+local daily_count = tonumber(state[3]) or 0
+local daily_start = tonumber(state[4]) or now
+tokens = math.min(rate, tokens + (now - last_refill) * rate)
+if now - daily_start > window then
+    daily_count = 0
+    daily_start = now
+end
+local result = 0
+if tokens < 1 then
+    result = 1
+elseif daily_count >= daily then
+    result = 2
+else
+    tokens = tokens - 1
+    daily_count = daily_count + 1
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "last_refill", now, "daily_count", daily_count, "daily_start", daily_start)
+redis.call("EXPIRE", KEYS[1], window)
+return result
+"""
+
+
+class RedisRateLimiter:
+    """Token bucket and daily cap stored in Redis, kept across server restarts.
+
+    Each check is a single EVALSHA round trip; keys expire on their own after a
+    day of inactivity. If Redis is unreachable the request is allowed, so an
+    outage degrades to no free-tier limit rather than no service. Exposes the
+    same check()/close() interface as RateLimiter.
+    """
+
+    def __init__(self, qps: int, daily: int, redis_url: str, key_prefix: str = "rl:"):
+        self.qps = qps
+        self.daily = daily
+        # Optional dependency, only needed when REDIS_URL is set
+        import redis.asyncio
+
+        self._redis = redis.asyncio.from_url(redis_url)
+        self._script = self._redis.register_script(REDIS_RATE_LIMIT_SCRIPT)
+        self._key_prefix = key_prefix
+
+    async def check(self, key: str) -> tuple[bool, str]:
+        try:
+            result = await self._script(
+                keys=[self._key_prefix + key], args=[self.qps, self.daily, DAILY_WINDOW_SECONDS]
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, allowing request: {e}")
+            return True, ""
+        if result == 1:
+            return False, _qps_error(self.qps)
+        if result == 2:
+            return False, _daily_error(self.daily)
+        return True, ""
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+# Available in-memory QPS algorithms (RATE_LIMIT_ALGORITHM value -> limiter class)
+RATE_LIMITERS: dict[str, type[RateLimiter]] = {
+    "gcra": GCRARateLimiter,
+    "token_bucket": TokenBucketRateLimiter,
+}
+
+
+def create_rate_limiter(
+    algorithm: str, qps: int, daily: int, max_clients: int, redis_url: str = ""
+) -> RateLimiter | RedisRateLimiter:
+    """Create the rate limiter for an algorithm name, or the Redis one when redis_url is set.
+
+    An empty algorithm selects the default: GCRA in memory, the token bucket in
+    Redis. Redis only implements the token bucket, so any other algorithm is
+    rejected rather than silently ignored.
+    """
+    if redis_url:
+        if algorithm not in ("", "token_bucket"):
+            raise ValueError(
+                f"Rate limit algorithm {algorithm} is not available with Redis; "
+                "unset RATE_LIMIT_ALGORITHM or set it to token_bucket"
+            )
+        return RedisRateLimiter(qps, daily, redis_url)
+    limiter_class = RATE_LIMITERS.get(algorithm or "gcra")
+    if limiter_class is None:
+        raise ValueError(f"Unknown rate limit algorithm: {algorithm}. Available: {', '.join(RATE_LIMITERS)}")
+    return limiter_class(qps, daily, max_clients)
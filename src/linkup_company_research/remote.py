@@ -8,17 +8,22 @@ Deploy to Railway, Render, or any platform that supports Python web servers.
 """
 
 import asyncio
+import functools
+import hashlib
 import os
 import time
 import logging
-import uuid
-from collections import defaultdict
+import re
+import secrets
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
 from pathlib import Path
+from urllib.parse import unquote_plus
 
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, HTMLResponse, FileResponse
+from starlette.responses import JSONResponse
 from starlette.routing import Route, Mount
 from starlette.staticfiles import StaticFiles
 from mcp.server.sse import SseServerTransport
@@ -27,7 +32,8 @@ from mcp.server.sse import SseServerTransport
 DOCS_DIR = Path(__file__).parent.parent.parent / "docs"
 
 # Import the MCP server instance and helpers
-from .server import mcp, set_api_key, close_http_client
+from .rate_limit import create_rate_limiter
+from .server import mcp, set_api_key, close_http_client, warm_http_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,36 +42,54 @@ logger = logging.getLogger(__name__)
 # SESSION MANAGEMENT
 # =============================================================================
 
-# Store API keys by session ID (session_id -> api_key)
-session_api_keys: dict[str, str] = {}
+# Session state is only read and written in code that doesn't await, so each
+# update runs atomically on the event loop and no lock is needed.
 
-# Store transports by session ID (session_id -> SseServerTransport)
-session_transports: dict[str, SseServerTransport] = {}
+@dataclass(slots=True)
+class Session:
+    """State for one SSE connection."""
 
-# Session timestamps for cleanup
-session_timestamps: dict[str, float] = {}
+    api_key: str
+    transport: SseServerTransport
+    last_active: float
 
-# Session cleanup lock
-session_lock = asyncio.Lock()
+
+# Active sessions by ID, ordered by last activity (oldest first)
+sessions: OrderedDict[str, Session] = OrderedDict()
+
+# Session IDs are secrets.token_hex(16); anything else is rejected before lookup
+SESSION_ID_RE = re.compile(r"[0-9a-f]{32}")
 
 # Session expiry time (1 hour)
 SESSION_EXPIRY_SECONDS = 3600
 
+# Time between background expiry sweeps
+SESSION_CLEANUP_INTERVAL_SECONDS = 30
+
 
 async def cleanup_expired_sessions():
-    """Remove expired sessions."""
-    async with session_lock:
-        now = time.time()
-        expired = [
-            sid for sid, ts in session_timestamps.items()
-            if now - ts > SESSION_EXPIRY_SECONDS
-        ]
-        for sid in expired:
-            session_api_keys.pop(sid, None)
-            session_transports.pop(sid, None)
-            session_timestamps.pop(sid, None)
-        if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+    """Remove expired sessions.
+
+    Timestamps are kept in last-activity order, so the sweep stops at the first
+    session that is still live instead of scanning all of them.
+    """
+    now = time.monotonic()
+    expired = 0
+    while sessions:
+        oldest = next(iter(sessions.values()))
+        if now - oldest.last_active <= SESSION_EXPIRY_SECONDS:
+            break
+        sessions.popitem(last=False)
+        expired += 1
+    if expired:
+        logger.info(f"Cleaned up {expired} expired sessions")
+
+
+async def run_session_cleanup():
+    """Sweep expired sessions in the background for the lifetime of the server."""
+    while True:
+        await asyncio.sleep(SESSION_CLEANUP_INTERVAL_SECONDS)
+        await cleanup_expired_sessions()
 
 
 # =============================================================================
@@ -79,13 +103,21 @@ FALLBACK_API_KEY = os.environ.get("LINKUP_API_KEY", "")
 RATE_LIMIT_QPS = 2  # Queries per second
 RATE_LIMIT_DAILY = 50  # Requests per day per IP
 
-# In-memory rate limiting (use Redis for production scale)
-rate_limit_qps: dict[str, list[float]] = defaultdict(list)
-rate_limit_daily: dict[str, int] = defaultdict(int)
-rate_limit_daily_reset: float = time.time()
+# Most client IPs tracked at once; the least recently seen are evicted beyond this
+RATE_LIMIT_MAX_CLIENTS = 100_000
+
+# QPS algorithm: "gcra" (default) or "token_bucket". Only "token_bucket" is
+# available with REDIS_URL, where it is also the default.
+RATE_LIMIT_ALGORITHM = os.environ.get("RATE_LIMIT_ALGORITHM", "")
+
+# Keep rate limit counters in Redis when set, so they survive restarts and
+# redeploys; otherwise they live in memory. The server itself still runs as a
+# single process (SSE sessions are in memory). Requires the optional `redis` package.
+REDIS_URL = os.environ.get("REDIS_URL", "")
 
-# Lock for thread-safe rate limit updates
-rate_limit_lock = asyncio.Lock()
+rate_limiter = create_rate_limiter(
+    RATE_LIMIT_ALGORITHM, RATE_LIMIT_QPS, RATE_LIMIT_DAILY, RATE_LIMIT_MAX_CLIENTS, redis_url=REDIS_URL
+)
 
 
 # =============================================================================
@@ -93,61 +125,55 @@ rate_limit_lock = asyncio.Lock()
 # =============================================================================
 
 
-def get_client_ip(request) -> str:
-    """Extract client IP from request headers (handles proxies)."""
-    forwarded = request.headers.get("x-forwarded-for")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
+# Proxy headers carrying the client IP, in priority order (ASGI header names are lowercase bytes)
+CLIENT_IP_HEADERS = (b"x-forwarded-for", b"x-real-ip", b"cf-connecting-ip")
 
-    real_ip = request.headers.get("x-real-ip")
-    if real_ip:
-        return real_ip
 
-    cf_ip = request.headers.get("cf-connecting-ip")
-    if cf_ip:
-        return cf_ip
-
-    return request.client.host if request.client else "unknown"
-
-
-def extract_api_key(request) -> str | None:
-    """Extract Linkup API key from URL query parameters."""
-    return request.query_params.get("apiKey") or request.query_params.get("api_key")
+def get_client_ip(scope) -> str:
+    """Extract client IP from request headers (handles proxies).
 
+    Scans the raw header list once instead of one case-insensitive lookup per header.
+    """
+    found: dict[bytes, bytes] = {}
+    for name, value in scope["headers"]:
+        if name in CLIENT_IP_HEADERS and value and name not in found:
+            found[name] = value
 
-async def check_rate_limit(client_ip: str) -> tuple[bool, str]:
-    """Check if client is within rate limits. Returns (allowed, error_message)."""
-    global rate_limit_daily_reset
+    for name in CLIENT_IP_HEADERS:
+        if name in found:
+            # X-Forwarded-For is "client, proxy1, proxy2"; only the first entry matters
+            return found[name].decode("latin-1").partition(",")[0].strip()
 
-    async with rate_limit_lock:
-        now = time.time()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
 
-        # Reset daily counters every 24 hours
-        if now - rate_limit_daily_reset > 86400:
-            rate_limit_daily.clear()
-            rate_limit_daily_reset = now
 
-        # Check QPS limit (sliding window)
-        recent_requests = [t for t in rate_limit_qps[client_ip] if now - t < 1.0]
-        rate_limit_qps[client_ip] = recent_requests
+# Query parameters carrying the user's Linkup API key, in priority order
+API_KEY_PARAMS = (b"apiKey", b"api_key")
 
-        if len(recent_requests) >= RATE_LIMIT_QPS:
-            return False, f"Rate limit exceeded: {RATE_LIMIT_QPS} requests per second. Add your own API key to remove limits."
 
-        # Check daily limit
-        if rate_limit_daily[client_ip] >= RATE_LIMIT_DAILY:
-            return False, f"Daily limit exceeded: {RATE_LIMIT_DAILY} requests per day. Add your own API key to remove limits."
+def extract_api_key(scope) -> str | None:
+    """Extract Linkup API key from URL query parameters.
 
-        # Record this request
-        rate_limit_qps[client_ip].append(now)
-        rate_limit_daily[client_ip] += 1
+    Scans the raw query string once for the two known parameters instead of
+    decoding every parameter into a QueryParams multidict.
+    """
+    found: dict[bytes, bytes] = {}
+    for piece in scope["query_string"].split(b"&"):
+        name, _, value = piece.partition(b"=")
+        if name in API_KEY_PARAMS:
+            # Last occurrence wins, as with QueryParams.get
+            found[name] = value
 
-        return True, ""
+    for name in API_KEY_PARAMS:
+        if found.get(name):
+            return unquote_plus(found[name].decode("latin-1"))
+    return None
 
 
-def get_api_key_for_request(request) -> tuple[str, bool]:
+def get_api_key_for_request(scope) -> tuple[str, bool]:
     """Get API key to use. Returns (api_key, is_user_provided)."""
-    user_key = extract_api_key(request)
+    user_key = extract_api_key(scope)
 
     # Accept any non-empty API key from user
     if user_key and len(user_key) > 10:
@@ -161,142 +187,216 @@ def get_api_key_for_request(request) -> tuple[str, bool]:
 # =============================================================================
 
 
-async def handle_sse(request):
+class ASGIEndpoint:
+    """Route endpoint wrapping an async (scope, receive, send) function.
+
+    Starlette treats plain functions as request -> response handlers; wrapping
+    marks the function as raw ASGI so no Request or Response object is built.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    async def __call__(self, scope, receive, send):
+        await self.func(scope, receive, send)
+
+
+@ASGIEndpoint
+async def handle_sse(scope, receive, send):
     """Handle SSE connections for MCP protocol.
 
     URL format: /sse or /sse?apiKey=lk-xxxxx
 
     Creates a unique session for each connection, storing the API key
-    so it persists across all messages in the session.
+    so it persists across all messages in the session. Runs as raw ASGI: the
+    SSE stream sends its own response, so there is nothing to return.
     """
-    api_key, is_user_provided = get_api_key_for_request(request)
-    client_ip = get_client_ip(request)
+    api_key, is_user_provided = get_api_key_for_request(scope)
+    client_ip = get_client_ip(scope)
 
     # Check if we have any API key to use
     if not api_key:
-        return JSONResponse(
+        response = JSONResponse(
             {"error": "No API key available. Please provide your Linkup API key: /sse?apiKey=lk-xxxxx"},
             status_code=401
         )
+        await response(scope, receive, send)
+        return
 
     # Apply rate limiting only for free tier (fallback key users)
     if not is_user_provided:
-        allowed, error_msg = await check_rate_limit(client_ip)
+        allowed, error_msg = await rate_limiter.check(client_ip)
         if not allowed:
-            return JSONResponse({"error": error_msg}, status_code=429)
+            response = JSONResponse({"error": error_msg}, status_code=429)
+            await response(scope, receive, send)
+            return
         logger.info(f"Free tier connection from {client_ip}")
     else:
         logger.info(f"User API key connection from {client_ip}")
 
-    # Cleanup expired sessions periodically
-    await cleanup_expired_sessions()
-
-    # Create a unique session ID for this connection
-    session_id = str(uuid.uuid4())
+    # Create a unique session ID for this connection. It authorizes message POSTs
+    # with this session's API key, so it must stay unguessable (128 random bits)
+    session_id = secrets.token_hex(16)
 
-    # Store the API key and create transport for this session
-    async with session_lock:
-        session_api_keys[session_id] = api_key
-        session_timestamps[session_id] = time.time()
-        # Create a transport that points to /messages/{session_id}
-        transport = SseServerTransport(f"/messages/{session_id}")
-        session_transports[session_id] = transport
+    # Create a transport that points to /messages/{session_id} and register the session
+    transport = SseServerTransport(f"/messages/{session_id}")
+    sessions[session_id] = Session(api_key, transport, time.monotonic())
 
     logger.info(f"Created session {session_id[:8]}... for client {client_ip}")
 
     try:
         # Use session-specific transport
-        async with transport.connect_sse(
-            request.scope, request.receive, request._send
-        ) as streams:
+        async with transport.connect_sse(scope, receive, send) as streams:
             # Set the API key for this session's context
             set_api_key(api_key)
             await mcp._mcp_server.run(
                 streams[0],
                 streams[1],
-                mcp._mcp_server.create_initialization_options()
+                scope["app"].state.init_options
             )
     finally:
         # Cleanup session when connection closes
-        async with session_lock:
-            session_api_keys.pop(session_id, None)
-            session_transports.pop(session_id, None)
-            session_timestamps.pop(session_id, None)
+        sessions.pop(session_id, None)
         logger.info(f"Closed session {session_id[:8]}...")
 
 
-async def handle_messages(request):
+@ASGIEndpoint
+async def handle_messages(scope, receive, send):
     """Handle POST messages for SSE transport.
 
     URL format: /messages/{session_id}
     Looks up the API key from the session store.
     """
-    # Extract session ID from path
-    session_id = request.path_params.get("session_id", "")
+    # The route only matches a non-empty session ID segment
+    session_id = scope["path_params"]["session_id"]
 
-    if not session_id:
-        return JSONResponse({"error": "Missing session ID"}, status_code=400)
+    # Look up the session and mark it as the most recently active. Expiry is
+    # checked here too, so a session idle past the limit is rejected even if
+    # the background sweep hasn't reached it yet.
+    now = time.monotonic()
+    session = sessions.get(session_id) if SESSION_ID_RE.fullmatch(session_id) else None
+    if session is not None and now - session.last_active > SESSION_EXPIRY_SECONDS:
+        sessions.pop(session_id, None)
+        session = None
+    if session is None:
+        response = JSONResponse({"error": "Session not found or expired"}, status_code=404)
+        await response(scope, receive, send)
+        return
+    session.last_active = now
+    sessions.move_to_end(session_id)
 
-    # Look up API key and transport for this session
-    async with session_lock:
-        api_key = session_api_keys.get(session_id)
-        transport = session_transports.get(session_id)
-        # Update session timestamp
-        if session_id in session_timestamps:
-            session_timestamps[session_id] = time.time()
+    # No set_api_key here: tool calls run in the MCP server task started by
+    # handle_sse, which already carries this session's key in its context.
+    # This POST only hands the message to that task.
 
-    if not api_key or not transport:
-        return JSONResponse({"error": "Session not found or expired"}, status_code=404)
+    # Use the session's transport to handle the message; it sends its own response
+    await session.transport.handle_post_message(scope, receive, send)
 
-    # Set the API key for this request
-    set_api_key(api_key)
 
-    # Use the session's transport to handle the message
-    return await transport.handle_post_message(request.scope, request.receive, request._send)
+# Constant part of the health payload, pre-serialized; only the session count varies
+HEALTH_BODY_PREFIX = b'{"status":"healthy","service":"linkup-company-research-mcp","active_sessions":'
 
+HEALTH_CONTENT_TYPE = (b"content-type", b"application/json")
 
-async def handle_health(request):
+
+@ASGIEndpoint
+async def handle_health(scope, receive, send):
     """Health check endpoint for Railway/load balancers."""
-    return JSONResponse({
-        "status": "healthy",
-        "service": "linkup-company-research-mcp",
-        "active_sessions": len(session_api_keys)
-    })
-
-
-async def handle_home(request):
-    """Serve the custom homepage from docs/index.html."""
-    index_path = DOCS_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path, media_type="text/html")
+    body = HEALTH_BODY_PREFIX + str(len(sessions)).encode() + b"}"
+    headers = [HEALTH_CONTENT_TYPE, (b"content-length", str(len(body)).encode())]
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+def load_docs_file(name: str) -> bytes | None:
+    """Read a file from the docs folder once at startup, or None if missing."""
+    path = DOCS_DIR / name
+    return path.read_bytes() if path.exists() else None
+
+
+class StaticBytesApp:
+    """ASGI endpoint that sends a fixed in-memory body with precomputed headers.
+
+    Skips Request/Response construction entirely for content that never changes,
+    and answers conditional GETs with a matching ETag with 304 Not Modified.
+    """
+
+    def __init__(self, body: bytes, media_type: str, cache_control: str = "no-cache"):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'.encode("latin-1")
+        self.not_modified_headers = [
+            (b"etag", self.etag),
+            (b"cache-control", cache_control.encode("latin-1")),
+        ]
+        self.headers = [
+            (b"content-type", media_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            *self.not_modified_headers,
+        ]
+
+    async def __call__(self, scope, receive, send):
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and self.etag in value:
+                await send({"type": "http.response.start", "status": 304, "headers": self.not_modified_headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        body = b"" if scope["method"] == "HEAD" else self.body
+        await send({"type": "http.response.body", "body": body})
+
+
+# Homepage, served from memory instead of stat+open on every request
+handle_home = StaticBytesApp(
+    load_docs_file("index.html")
     # Fallback if docs/index.html doesn't exist
-    return HTMLResponse("<h1>Linkup Company Research MCP</h1><p>Visit /sse to connect.</p>")
+    or b"<h1>Linkup Company Research MCP</h1><p>Visit /sse to connect.</p>",
+    "text/html; charset=utf-8",
+)
+
+LOGO_PNG = load_docs_file("logo.png")
 
 
-async def handle_logo(request):
-    """Serve the logo image."""
-    logo_path = DOCS_DIR / "logo.png"
-    if logo_path.exists():
-        return FileResponse(logo_path, media_type="image/png")
+async def handle_logo_missing(request):
+    """Report the missing logo image."""
     return JSONResponse({"error": "Logo not found"}, status_code=404)
 
 
+# Logo image, cached by clients for a day and revalidated by ETag
+handle_logo = (
+    StaticBytesApp(LOGO_PNG, "image/png", cache_control="public, max-age=86400")
+    if LOGO_PNG is not None
+    else handle_logo_missing
+)
+
+
 @asynccontextmanager
 async def lifespan(app):
     """Manage startup and shutdown events."""
     logger.info("Linkup Company Research MCP server starting...")
     logger.info(f"Fallback API key configured: {bool(FALLBACK_API_KEY)}")
+    logger.info(f"Rate limit state: {'redis' if REDIS_URL else 'in-memory'}")
+    # Server name, version and capabilities are fixed once all tools are registered
+    app.state.init_options = mcp._mcp_server.create_initialization_options()
+    # Warm the Linkup connection in the background so startup isn't delayed
+    warm_task = asyncio.create_task(warm_http_client())
+    # Expire idle sessions off the connection path
+    cleanup_task = asyncio.create_task(run_session_cleanup())
     yield
     logger.info("Linkup Company Research MCP server shutting down...")
+    warm_task.cancel()
+    cleanup_task.cancel()
+    await asyncio.gather(warm_task, cleanup_task, return_exceptions=True)
     await close_http_client()
+    await rate_limiter.close()
 
 
 # Create Starlette app with routes
 routes = [
-    Route("/", handle_home),
-    Route("/logo.png", handle_logo),
-    Route("/health", handle_health),
-    Route("/sse", handle_sse),
+    Route("/", handle_home, methods=["GET"]),
+    Route("/logo.png", handle_logo, methods=["GET"]),
+    Route("/health", handle_health, methods=["GET"]),
+    Route("/sse", handle_sse, methods=["GET"]),
     Route("/messages/{session_id}", handle_messages, methods=["POST"]),
 ]
 
@@ -316,11 +416,17 @@ def main():
 
     logger.info(f"Binding to {host}:{port}")
 
+    # Single process: sessions live in memory, so every POST for a session must
+    # reach the worker holding its SSE stream. uvicorn picks uvloop and httptools
+    # on its own when installed (remote extra).
     uvicorn.run(
         app,
         host=host,
         port=port,
         log_level="info",
+        backlog=4096,
+        # Outlive typical 60s proxy idle timeouts so the proxy closes idle connections first
+        timeout_keep_alive=75,
     )
 
 
@@ -4,7 +4,24 @@ Supports 17 comprehensive company profile tools.
 """
 
 import json
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+# =============================================================================
+# SHARED FRAGMENTS
+# =============================================================================
+
+# Leaf types reused across every schema below. They are shared objects, so
+# nothing may mutate a schema in place.
+_STRING: dict[str, Any] = {"type": "string"}
+_INTEGER: dict[str, Any] = {"type": "integer"}
+_NUMBER: dict[str, Any] = {"type": "number"}
+_BOOLEAN: dict[str, Any] = {"type": "boolean"}
+_STRING_ARRAY: dict[str, Any] = {"type": "array", "items": _STRING}
+
+# Low/medium/high rating used by every risk and severity field
+_RISK_LEVEL: dict[str, Any] = {"type": "string", "enum": ["low", "medium", "high"]}
 
 
 # =============================================================================
@@ -14,21 +31,18 @@ from typing import Any
 COMPANY_OVERVIEW_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
-        "legal_name": {"type": "string"},
-        "website": {"type": "string"},
-        "founded_year": {"type": "integer"},
-        "founders": {
-            "type": "array",
-            "items": {"type": "string"}
-        },
-        "origin_story": {"type": "string"},
+        "company_name": _STRING,
+        "legal_name": _STRING,
+        "website": _STRING,
+        "founded_year": _INTEGER,
+        "founders": _STRING_ARRAY,
+        "origin_story": _STRING,
         "headquarters": {
             "type": "object",
             "properties": {
-                "city": {"type": "string"},
-                "state": {"type": "string"},
-                "country": {"type": "string"}
+                "city": _STRING,
+                "state": _STRING,
+                "country": _STRING
             }
         },
         "office_locations": {
@@ -36,14 +50,14 @@ COMPANY_OVERVIEW_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "city": {"type": "string"},
-                    "country": {"type": "string"},
-                    "type": {"type": "string"}
+                    "city": _STRING,
+                    "country": _STRING,
+                    "type": _STRING
                 }
             }
         },
-        "employee_count": {"type": "integer"},
-        "employee_count_range": {"type": "string"},
+        "employee_count": _INTEGER,
+        "employee_count_range": _STRING,
         "employee_growth_trend": {
             "type": "string",
             "enum": ["growing", "stable", "declining"]
@@ -52,10 +66,10 @@ COMPANY_OVERVIEW_SCHEMA: dict[str, Any] = {
             "type": "string",
             "enum": ["seed", "early", "growth", "mature", "public", "turnaround"]
         },
-        "description": {"type": "string"},
-        "mission_statement": {"type": "string"},
-        "linkedin_url": {"type": "string"},
-        "twitter_url": {"type": "string"}
+        "description": _STRING,
+        "mission_statement": _STRING,
+        "linkedin_url": _STRING,
+        "twitter_url": _STRING
     },
     "required": ["company_name", "description"]
 }
@@ -68,21 +82,21 @@ COMPANY_OVERVIEW_SCHEMA: dict[str, Any] = {
 COMPANY_PRODUCTS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "products": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "description": {"type": "string"},
+                    "name": _STRING,
+                    "description": _STRING,
                     "product_type": {
                         "type": "string",
                         "enum": ["software", "hardware", "service", "platform", "api", "data"]
                     },
-                    "target_use_cases": {"type": "array", "items": {"type": "string"}},
-                    "key_features": {"type": "array", "items": {"type": "string"}},
-                    "launch_date": {"type": "string"}
+                    "target_use_cases": _STRING_ARRAY,
+                    "key_features": _STRING_ARRAY,
+                    "launch_date": _STRING
                 }
             }
         },
@@ -91,9 +105,9 @@ COMPANY_PRODUCTS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "service_type": {"type": "string"}
+                    "name": _STRING,
+                    "description": _STRING,
+                    "service_type": _STRING
                 }
             }
         },
@@ -106,15 +120,15 @@ COMPANY_PRODUCTS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "tier_name": {"type": "string"},
-                    "price": {"type": "string"},
-                    "billing_frequency": {"type": "string"},
-                    "features": {"type": "array", "items": {"type": "string"}}
+                    "tier_name": _STRING,
+                    "price": _STRING,
+                    "billing_frequency": _STRING,
+                    "features": _STRING_ARRAY
                 }
             }
         },
-        "free_trial": {"type": "boolean"},
-        "pricing_url": {"type": "string"}
+        "free_trial": _BOOLEAN,
+        "pricing_url": _STRING
     },
     "required": ["company_name"]
 }
@@ -127,7 +141,7 @@ COMPANY_PRODUCTS_SCHEMA: dict[str, Any] = {
 COMPANY_BUSINESS_MODEL_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "business_type": {
             "type": "string",
             "enum": ["B2B", "B2C", "B2B2C", "D2C", "B2G", "C2C"]
@@ -142,21 +156,21 @@ COMPANY_BUSINESS_MODEL_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "stream_name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "percentage_of_revenue": {"type": "string"}
+                    "stream_name": _STRING,
+                    "description": _STRING,
+                    "percentage_of_revenue": _STRING
                 }
             }
         },
-        "monetization_strategy": {"type": "string"},
+        "monetization_strategy": _STRING,
         "unit_economics": {
             "type": "object",
             "properties": {
-                "cac": {"type": "string"},
-                "ltv": {"type": "string"},
-                "ltv_cac_ratio": {"type": "string"},
-                "payback_period": {"type": "string"},
-                "gross_margin": {"type": "string"}
+                "cac": _STRING,
+                "ltv": _STRING,
+                "ltv_cac_ratio": _STRING,
+                "payback_period": _STRING,
+                "gross_margin": _STRING
             }
         },
         "go_to_market": {
@@ -179,7 +193,7 @@ COMPANY_BUSINESS_MODEL_SCHEMA: dict[str, Any] = {
 COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "ideal_customer_profile": {
             "type": "object",
             "properties": {
@@ -187,9 +201,9 @@ COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
                     "type": "string",
                     "enum": ["SMB", "mid_market", "enterprise", "all"]
                 },
-                "industries": {"type": "array", "items": {"type": "string"}},
-                "job_titles": {"type": "array", "items": {"type": "string"}},
-                "pain_points": {"type": "array", "items": {"type": "string"}}
+                "industries": _STRING_ARRAY,
+                "job_titles": _STRING_ARRAY,
+                "pain_points": _STRING_ARRAY
             }
         },
         "customer_segments": {
@@ -197,9 +211,9 @@ COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "segment_name": {"type": "string"},
-                    "description": {"type": "string"},
-                    "size_estimate": {"type": "string"}
+                    "segment_name": _STRING,
+                    "description": _STRING,
+                    "size_estimate": _STRING
                 }
             }
         },
@@ -208,7 +222,7 @@ COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "region": {"type": "string"},
+                    "region": _STRING,
                     "priority": {
                         "type": "string",
                         "enum": ["primary", "secondary", "emerging"]
@@ -216,8 +230,8 @@ COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
                 }
             }
         },
-        "vertical_focus": {"type": "array", "items": {"type": "string"}},
-        "use_case_verticals": {"type": "array", "items": {"type": "string"}},
+        "vertical_focus": _STRING_ARRAY,
+        "use_case_verticals": _STRING_ARRAY,
         "market_approach": {
             "type": "string",
             "enum": ["horizontal", "vertical", "hybrid"]
@@ -234,14 +248,14 @@ COMPANY_TARGET_MARKET_SCHEMA: dict[str, Any] = {
 COMPANY_FINANCIALS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "revenue": {
             "type": "object",
             "properties": {
-                "amount": {"type": "string"},
-                "currency": {"type": "string"},
-                "period": {"type": "string"},
-                "date": {"type": "string"},
+                "amount": _STRING,
+                "currency": _STRING,
+                "period": _STRING,
+                "date": _STRING,
                 "revenue_type": {
                     "type": "string",
                     "enum": ["ARR", "MRR", "GMV", "total_revenue", "run_rate"]
@@ -253,33 +267,33 @@ COMPANY_FINANCIALS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "amount": {"type": "string"},
-                    "period": {"type": "string"},
-                    "date": {"type": "string"}
+                    "amount": _STRING,
+                    "period": _STRING,
+                    "date": _STRING
                 }
             }
         },
-        "revenue_growth_rate": {"type": "string"},
+        "revenue_growth_rate": _STRING,
         "profitability_status": {
             "type": "string",
             "enum": ["profitable", "break_even", "unprofitable"]
         },
-        "path_to_profitability": {"type": "string"},
-        "gross_margin": {"type": "string"},
+        "path_to_profitability": _STRING,
+        "gross_margin": _STRING,
         "key_metrics": {
             "type": "object",
             "properties": {
-                "arr": {"type": "string"},
-                "mrr": {"type": "string"},
-                "gmv": {"type": "string"},
-                "acv": {"type": "string"},
-                "nrr": {"type": "string"},
-                "churn_rate": {"type": "string"}
+                "arr": _STRING,
+                "mrr": _STRING,
+                "gmv": _STRING,
+                "acv": _STRING,
+                "nrr": _STRING,
+                "churn_rate": _STRING
             }
         },
-        "burn_rate": {"type": "string"},
-        "runway_months": {"type": "integer"},
-        "financial_health_signals": {"type": "array", "items": {"type": "string"}}
+        "burn_rate": _STRING,
+        "runway_months": _INTEGER,
+        "financial_health_signals": _STRING_ARRAY
     },
     "required": ["company_name"]
 }
@@ -292,8 +306,8 @@ COMPANY_FINANCIALS_SCHEMA: dict[str, Any] = {
 COMPANY_FUNDING_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
-        "total_funding": {"type": "string"},
+        "company_name": _STRING,
+        "total_funding": _STRING,
         "funding_rounds": {
             "type": "array",
             "items": {
@@ -304,21 +318,21 @@ COMPANY_FUNDING_SCHEMA: dict[str, Any] = {
                         "enum": ["Pre-Seed", "Seed", "Series A", "Series B", "Series C",
                                  "Series D", "Series E+", "Growth", "Debt", "Grant", "Other"]
                     },
-                    "date": {"type": "string"},
-                    "amount": {"type": "string"},
-                    "currency": {"type": "string"},
-                    "lead_investors": {"type": "array", "items": {"type": "string"}},
-                    "participating_investors": {"type": "array", "items": {"type": "string"}},
-                    "valuation_at_round": {"type": "string"}
+                    "date": _STRING,
+                    "amount": _STRING,
+                    "currency": _STRING,
+                    "lead_investors": _STRING_ARRAY,
+                    "participating_investors": _STRING_ARRAY,
+                    "valuation_at_round": _STRING
                 }
             }
         },
         "latest_valuation": {
             "type": "object",
             "properties": {
-                "amount": {"type": "string"},
-                "date": {"type": "string"},
-                "source": {"type": "string"},
+                "amount": _STRING,
+                "date": _STRING,
+                "source": _STRING,
                 "valuation_type": {
                     "type": "string",
                     "enum": ["pre_money", "post_money"]
@@ -330,9 +344,9 @@ COMPANY_FUNDING_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "amount": {"type": "string"},
-                    "date": {"type": "string"},
-                    "round": {"type": "string"}
+                    "amount": _STRING,
+                    "date": _STRING,
+                    "round": _STRING
                 }
             }
         },
@@ -341,17 +355,17 @@ COMPANY_FUNDING_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
+                    "name": _STRING,
                     "type": {
                         "type": "string",
                         "enum": ["vc", "pe", "angel", "strategic", "corporate", "government", "family_office"]
                     },
-                    "rounds_participated": {"type": "array", "items": {"type": "string"}}
+                    "rounds_participated": _STRING_ARRAY
                 }
             }
         },
-        "notable_shareholders": {"type": "array", "items": {"type": "string"}},
-        "debt_financing": {"type": "string"}
+        "notable_shareholders": _STRING_ARRAY,
+        "debt_financing": _STRING
     },
     "required": ["company_name"]
 }
@@ -364,14 +378,14 @@ COMPANY_FUNDING_SCHEMA: dict[str, Any] = {
 COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "ceo": {
             "type": "object",
             "properties": {
-                "name": {"type": "string"},
-                "tenure_start": {"type": "string"},
-                "background": {"type": "string"},
-                "linkedin_url": {"type": "string"}
+                "name": _STRING,
+                "tenure_start": _STRING,
+                "background": _STRING,
+                "linkedin_url": _STRING
             }
         },
         "c_suite": {
@@ -379,12 +393,12 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "title": {"type": "string"},
-                    "tenure_start": {"type": "string"},
-                    "background": {"type": "string"},
-                    "previous_companies": {"type": "array", "items": {"type": "string"}},
-                    "linkedin_url": {"type": "string"}
+                    "name": _STRING,
+                    "title": _STRING,
+                    "tenure_start": _STRING,
+                    "background": _STRING,
+                    "previous_companies": _STRING_ARRAY,
+                    "linkedin_url": _STRING
                 }
             }
         },
@@ -393,10 +407,10 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "current_title": {"type": "string"},
-                    "is_active": {"type": "boolean"},
-                    "role_in_company": {"type": "string"}
+                    "name": _STRING,
+                    "current_title": _STRING,
+                    "is_active": _BOOLEAN,
+                    "role_in_company": _STRING
                 }
             }
         },
@@ -405,8 +419,8 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "affiliation": {"type": "string"},
+                    "name": _STRING,
+                    "affiliation": _STRING,
                     "board_role": {
                         "type": "string",
                         "enum": ["chair", "member", "observer"]
@@ -419,10 +433,10 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "title": {"type": "string"},
-                    "hire_date": {"type": "string"},
-                    "previous_company": {"type": "string"}
+                    "name": _STRING,
+                    "title": _STRING,
+                    "hire_date": _STRING,
+                    "previous_company": _STRING
                 }
             }
         },
@@ -431,10 +445,10 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "former_title": {"type": "string"},
-                    "departure_date": {"type": "string"},
-                    "reason": {"type": "string"}
+                    "name": _STRING,
+                    "former_title": _STRING,
+                    "departure_date": _STRING,
+                    "reason": _STRING
                 }
             }
         },
@@ -454,26 +468,26 @@ COMPANY_LEADERSHIP_SCHEMA: dict[str, Any] = {
 COMPANY_CULTURE_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "glassdoor": {
             "type": "object",
             "properties": {
-                "overall_rating": {"type": "number"},
-                "review_count": {"type": "integer"},
-                "recommend_to_friend_pct": {"type": "string"},
-                "ceo_approval_pct": {"type": "string"},
-                "pros": {"type": "array", "items": {"type": "string"}},
-                "cons": {"type": "array", "items": {"type": "string"}}
+                "overall_rating": _NUMBER,
+                "review_count": _INTEGER,
+                "recommend_to_friend_pct": _STRING,
+                "ceo_approval_pct": _STRING,
+                "pros": _STRING_ARRAY,
+                "cons": _STRING_ARRAY
             }
         },
         "employer_reputation": {
             "type": "object",
             "properties": {
-                "awards": {"type": "array", "items": {"type": "string"}},
-                "employer_brand_score": {"type": "string"}
+                "awards": _STRING_ARRAY,
+                "employer_brand_score": _STRING
             }
         },
-        "culture_attributes": {"type": "array", "items": {"type": "string"}},
+        "culture_attributes": _STRING_ARRAY,
         "work_policy": {
             "type": "object",
             "properties": {
@@ -481,17 +495,17 @@ COMPANY_CULTURE_SCHEMA: dict[str, Any] = {
                     "type": "string",
                     "enum": ["remote", "hybrid", "in_office"]
                 },
-                "details": {"type": "string"},
-                "office_requirements": {"type": "string"}
+                "details": _STRING,
+                "office_requirements": _STRING
             }
         },
-        "dei_initiatives": {"type": "array", "items": {"type": "string"}},
-        "benefits_highlights": {"type": "array", "items": {"type": "string"}},
+        "dei_initiatives": _STRING_ARRAY,
+        "benefits_highlights": _STRING_ARRAY,
         "linkedin_insights": {
             "type": "object",
             "properties": {
-                "employee_count": {"type": "integer"},
-                "median_tenure": {"type": "string"}
+                "employee_count": _INTEGER,
+                "median_tenure": _STRING
             }
         }
     },
@@ -506,39 +520,39 @@ COMPANY_CULTURE_SCHEMA: dict[str, Any] = {
 COMPANY_CLIENTS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "notable_customers": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "industry": {"type": "string"},
-                    "company_size": {"type": "string"},
-                    "logo_tier": {"type": "string"},
+                    "name": _STRING,
+                    "industry": _STRING,
+                    "company_size": _STRING,
+                    "logo_tier": _STRING,
                     "verification_source": {
                         "type": "string",
                         "enum": ["case_study", "press_release", "logo", "review", "testimonial"]
                     },
-                    "use_case": {"type": "string"},
-                    "outcomes": {"type": "string"}
+                    "use_case": _STRING,
+                    "outcomes": _STRING
                 }
             }
         },
         "customer_count": {
             "type": "object",
             "properties": {
-                "total": {"type": "string"},
-                "date": {"type": "string"},
-                "source": {"type": "string"}
+                "total": _STRING,
+                "date": _STRING,
+                "source": _STRING
             }
         },
         "customer_count_by_segment": {
             "type": "object",
             "properties": {
-                "enterprise": {"type": "string"},
-                "mid_market": {"type": "string"},
-                "smb": {"type": "string"}
+                "enterprise": _STRING,
+                "mid_market": _STRING,
+                "smb": _STRING
             }
         },
         "case_studies": {
@@ -546,11 +560,11 @@ COMPANY_CLIENTS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "customer": {"type": "string"},
-                    "title": {"type": "string"},
-                    "summary": {"type": "string"},
-                    "key_metrics": {"type": "array", "items": {"type": "string"}},
-                    "url": {"type": "string"}
+                    "customer": _STRING,
+                    "title": _STRING,
+                    "summary": _STRING,
+                    "key_metrics": _STRING_ARRAY,
+                    "url": _STRING
                 }
             }
         },
@@ -559,14 +573,14 @@ COMPANY_CLIENTS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "segment": {"type": "string"},
-                    "percentage": {"type": "string"},
-                    "characteristics": {"type": "string"}
+                    "segment": _STRING,
+                    "percentage": _STRING,
+                    "characteristics": _STRING
                 }
             }
         },
-        "logo_wall": {"type": "array", "items": {"type": "string"}},
-        "nps_score": {"type": "string"}
+        "logo_wall": _STRING_ARRAY,
+        "nps_score": _STRING
     },
     "required": ["company_name"]
 }
@@ -579,21 +593,21 @@ COMPANY_CLIENTS_SCHEMA: dict[str, Any] = {
 COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "strategic_partnerships": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "partner_name": {"type": "string"},
-                    "partner_website": {"type": "string"},
+                    "partner_name": _STRING,
+                    "partner_website": _STRING,
                     "partnership_type": {
                         "type": "string",
                         "enum": ["strategic", "technology", "channel", "platform",
                                  "integration", "reseller", "consulting", "go_to_market"]
                     },
-                    "description": {"type": "string"},
-                    "date_announced": {"type": "string"}
+                    "description": _STRING,
+                    "date_announced": _STRING
                 }
             }
         },
@@ -602,13 +616,13 @@ COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "category": {"type": "string"},
+                    "name": _STRING,
+                    "category": _STRING,
                     "integration_type": {
                         "type": "string",
                         "enum": ["native", "api", "third_party", "marketplace"]
                     },
-                    "description": {"type": "string"}
+                    "description": _STRING
                 }
             }
         },
@@ -617,9 +631,9 @@ COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "type": {"type": "string"},
-                    "regions": {"type": "array", "items": {"type": "string"}}
+                    "name": _STRING,
+                    "type": _STRING,
+                    "regions": _STRING_ARRAY
                 }
             }
         },
@@ -628,8 +642,8 @@ COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "supplier": {"type": "string"},
-                    "dependency_type": {"type": "string"},
+                    "supplier": _STRING,
+                    "dependency_type": _STRING,
                     "criticality": {
                         "type": "string",
                         "enum": ["critical", "important", "minor"]
@@ -640,10 +654,10 @@ COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
         "partner_program": {
             "type": "object",
             "properties": {
-                "exists": {"type": "boolean"},
-                "name": {"type": "string"},
-                "tiers": {"type": "array", "items": {"type": "string"}},
-                "url": {"type": "string"}
+                "exists": _BOOLEAN,
+                "name": _STRING,
+                "tiers": _STRING_ARRAY,
+                "url": _STRING
             }
         }
     },
@@ -658,60 +672,60 @@ COMPANY_PARTNERSHIPS_SCHEMA: dict[str, Any] = {
 COMPANY_TECHNOLOGY_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
-        "proprietary_technology": {"type": "string"},
+        "company_name": _STRING,
+        "proprietary_technology": _STRING,
         "patents": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "title": {"type": "string"},
-                    "number": {"type": "string"},
+                    "title": _STRING,
+                    "number": _STRING,
                     "status": {
                         "type": "string",
                         "enum": ["granted", "pending", "filed"]
                     },
-                    "date": {"type": "string"}
+                    "date": _STRING
                 }
             }
         },
         "tech_stack": {
             "type": "object",
             "properties": {
-                "languages": {"type": "array", "items": {"type": "string"}},
-                "frameworks": {"type": "array", "items": {"type": "string"}},
-                "databases": {"type": "array", "items": {"type": "string"}},
-                "infrastructure": {"type": "array", "items": {"type": "string"}},
-                "cloud_providers": {"type": "array", "items": {"type": "string"}},
-                "devops_tools": {"type": "array", "items": {"type": "string"}}
+                "languages": _STRING_ARRAY,
+                "frameworks": _STRING_ARRAY,
+                "databases": _STRING_ARRAY,
+                "infrastructure": _STRING_ARRAY,
+                "cloud_providers": _STRING_ARRAY,
+                "devops_tools": _STRING_ARRAY
             }
         },
-        "rd_focus_areas": {"type": "array", "items": {"type": "string"}},
+        "rd_focus_areas": _STRING_ARRAY,
         "ai_capabilities": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "capability": {"type": "string"},
-                    "description": {"type": "string"}
+                    "capability": _STRING,
+                    "description": _STRING
                 }
             }
         },
-        "data_capabilities": {"type": "string"},
+        "data_capabilities": _STRING,
         "open_source": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "url": {"type": "string"},
-                    "description": {"type": "string"},
-                    "stars": {"type": "integer"}
+                    "name": _STRING,
+                    "url": _STRING,
+                    "description": _STRING,
+                    "stars": _INTEGER
                 }
             }
         },
-        "certifications": {"type": "array", "items": {"type": "string"}},
-        "technical_differentiators": {"type": "array", "items": {"type": "string"}}
+        "certifications": _STRING_ARRAY,
+        "technical_differentiators": _STRING_ARRAY
     },
     "required": ["company_name"]
 }
@@ -724,15 +738,15 @@ COMPANY_TECHNOLOGY_SCHEMA: dict[str, Any] = {
 COMPETITIVE_LANDSCAPE_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "main_competitors": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string"},
-                    "website": {"type": "string"},
-                    "description": {"type": "string"},
+                    "name": _STRING,
+                    "website": _STRING,
+                    "description": _STRING,
                     "competitor_type": {
                         "type": "string",
                         "enum": ["direct", "indirect"]
@@ -745,16 +759,16 @@ COMPETITIVE_LANDSCAPE_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "product": {"type": "string"},
-                    "competitors": {"type": "array", "items": {"type": "string"}}
+                    "product": _STRING,
+                    "competitors": _STRING_ARRAY
                 }
             }
         },
-        "competitive_positioning": {"type": "string"},
-        "key_differentiators": {"type": "array", "items": {"type": "string"}},
-        "competitive_advantages": {"type": "array", "items": {"type": "string"}},
-        "competitive_weaknesses": {"type": "array", "items": {"type": "string"}},
-        "market_share_estimate": {"type": "string"},
+        "competitive_positioning": _STRING,
+        "key_differentiators": _STRING_ARRAY,
+        "competitive_advantages": _STRING_ARRAY,
+        "competitive_weaknesses": _STRING_ARRAY,
+        "market_share_estimate": _STRING,
         "market_position": {
             "type": "string",
             "enum": ["leader", "challenger", "follower", "niche", "emerging"]
@@ -771,33 +785,33 @@ COMPETITIVE_LANDSCAPE_SCHEMA: dict[str, Any] = {
 COMPANY_MARKET_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "industry_classification": {
             "type": "object",
             "properties": {
-                "primary_industry": {"type": "string"},
-                "sub_industry": {"type": "string"},
-                "sic_code": {"type": "string"},
-                "naics_code": {"type": "string"}
+                "primary_industry": _STRING,
+                "sub_industry": _STRING,
+                "sic_code": _STRING,
+                "naics_code": _STRING
             }
         },
         "market_size": {
             "type": "object",
             "properties": {
-                "tam": {"type": "string"},
-                "sam": {"type": "string"},
-                "som": {"type": "string"},
-                "currency": {"type": "string"},
-                "year": {"type": "string"},
-                "source": {"type": "string"}
+                "tam": _STRING,
+                "sam": _STRING,
+                "som": _STRING,
+                "currency": _STRING,
+                "year": _STRING,
+                "source": _STRING
             }
         },
         "industry_growth_rate": {
             "type": "object",
             "properties": {
-                "rate": {"type": "string"},
-                "period": {"type": "string"},
-                "source": {"type": "string"}
+                "rate": _STRING,
+                "period": _STRING,
+                "source": _STRING
             }
         },
         "market_trends": {
@@ -805,21 +819,18 @@ COMPANY_MARKET_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "trend": {"type": "string"},
-                    "impact": {"type": "string"},
-                    "timeframe": {"type": "string"}
+                    "trend": _STRING,
+                    "impact": _STRING,
+                    "timeframe": _STRING
                 }
             }
         },
         "regulatory_environment": {
             "type": "object",
             "properties": {
-                "key_regulations": {"type": "array", "items": {"type": "string"}},
-                "compliance_requirements": {"type": "array", "items": {"type": "string"}},
-                "regulatory_risk_level": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"]
-                }
+                "key_regulations": _STRING_ARRAY,
+                "compliance_requirements": _STRING_ARRAY,
+                "regulatory_risk_level": _RISK_LEVEL
             }
         },
         "industry_dynamics": {
@@ -833,7 +844,7 @@ COMPANY_MARKET_SCHEMA: dict[str, Any] = {
                     "type": "string",
                     "enum": ["fragmented", "consolidated"]
                 },
-                "barriers_to_entry": {"type": "array", "items": {"type": "string"}}
+                "barriers_to_entry": _STRING_ARRAY
             }
         }
     },
@@ -848,22 +859,22 @@ COMPANY_MARKET_SCHEMA: dict[str, Any] = {
 COMPANY_NEWS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "recent_news": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "headline": {"type": "string"},
-                    "date": {"type": "string"},
-                    "source": {"type": "string"},
-                    "url": {"type": "string"},
+                    "headline": _STRING,
+                    "date": _STRING,
+                    "source": _STRING,
+                    "url": _STRING,
                     "category": {
                         "type": "string",
                         "enum": ["product_launch", "funding", "partnership", "m_and_a",
                                  "executive", "expansion", "legal", "other"]
                     },
-                    "summary": {"type": "string"},
+                    "summary": _STRING,
                     "sentiment": {
                         "type": "string",
                         "enum": ["positive", "negative", "neutral"]
@@ -876,10 +887,10 @@ COMPANY_NEWS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "product_name": {"type": "string"},
-                    "launch_date": {"type": "string"},
-                    "description": {"type": "string"},
-                    "url": {"type": "string"}
+                    "product_name": _STRING,
+                    "launch_date": _STRING,
+                    "description": _STRING,
+                    "url": _STRING
                 }
             }
         },
@@ -888,20 +899,20 @@ COMPANY_NEWS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "partner": {"type": "string"},
-                    "date": {"type": "string"},
-                    "partnership_type": {"type": "string"},
-                    "description": {"type": "string"}
+                    "partner": _STRING,
+                    "date": _STRING,
+                    "partnership_type": _STRING,
+                    "description": _STRING
                 }
             }
         },
         "funding_activity": {
             "type": "object",
             "properties": {
-                "recent_raise": {"type": "string"},
-                "date": {"type": "string"},
-                "amount": {"type": "string"},
-                "investors": {"type": "array", "items": {"type": "string"}}
+                "recent_raise": _STRING,
+                "date": _STRING,
+                "amount": _STRING,
+                "investors": _STRING_ARRAY
             }
         },
         "ma_activity": {
@@ -912,16 +923,16 @@ COMPANY_NEWS_SCHEMA: dict[str, Any] = {
                     "items": {
                         "type": "object",
                         "properties": {
-                            "target": {"type": "string"},
-                            "date": {"type": "string"},
-                            "value": {"type": "string"}
+                            "target": _STRING,
+                            "date": _STRING,
+                            "value": _STRING
                         }
                     }
                 },
-                "acquisition_rumors": {"type": "string"}
+                "acquisition_rumors": _STRING
             }
         },
-        "press_highlights": {"type": "array", "items": {"type": "string"}}
+        "press_highlights": _STRING_ARRAY
     },
     "required": ["company_name"]
 }
@@ -934,20 +945,20 @@ COMPANY_NEWS_SCHEMA: dict[str, Any] = {
 COMPANY_STRATEGY_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "growth_strategy": {
             "type": "object",
             "properties": {
-                "description": {"type": "string"},
-                "key_initiatives": {"type": "array", "items": {"type": "string"}}
+                "description": _STRING,
+                "key_initiatives": _STRING_ARRAY
             }
         },
         "expansion_plans": {
             "type": "object",
             "properties": {
-                "geographic": {"type": "array", "items": {"type": "string"}},
-                "product": {"type": "array", "items": {"type": "string"}},
-                "vertical": {"type": "array", "items": {"type": "string"}}
+                "geographic": _STRING_ARRAY,
+                "product": _STRING_ARRAY,
+                "vertical": _STRING_ARRAY
             }
         },
         "ma_history": {
@@ -955,18 +966,18 @@ COMPANY_STRATEGY_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "target_company": {"type": "string"},
-                    "date": {"type": "string"},
-                    "deal_value": {"type": "string"},
-                    "rationale": {"type": "string"}
+                    "target_company": _STRING,
+                    "date": _STRING,
+                    "deal_value": _STRING,
+                    "rationale": _STRING
                 }
             }
         },
         "acquisition_rumors": {
             "type": "object",
             "properties": {
-                "as_acquirer": {"type": "array", "items": {"type": "string"}},
-                "as_target": {"type": "array", "items": {"type": "string"}}
+                "as_acquirer": _STRING_ARRAY,
+                "as_target": _STRING_ARRAY
             }
         },
         "ipo_signals": {
@@ -976,11 +987,11 @@ COMPANY_STRATEGY_SCHEMA: dict[str, Any] = {
                     "type": "string",
                     "enum": ["not_planned", "considering", "preparing", "filed", "public"]
                 },
-                "expected_timeline": {"type": "string"},
-                "indicators": {"type": "array", "items": {"type": "string"}}
+                "expected_timeline": _STRING,
+                "indicators": _STRING_ARRAY
             }
         },
-        "strategic_priorities": {"type": "array", "items": {"type": "string"}}
+        "strategic_priorities": _STRING_ARRAY
     },
     "required": ["company_name"]
 }
@@ -993,18 +1004,15 @@ COMPANY_STRATEGY_SCHEMA: dict[str, Any] = {
 COMPANY_RISKS_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "competitive_risks": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "risk": {"type": "string"},
-                    "severity": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"]
-                    },
-                    "description": {"type": "string"}
+                    "risk": _STRING,
+                    "severity": _RISK_LEVEL,
+                    "description": _STRING
                 }
             }
         },
@@ -1013,13 +1021,10 @@ COMPANY_RISKS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "regulation": {"type": "string"},
-                    "jurisdiction": {"type": "string"},
-                    "risk_level": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"]
-                    },
-                    "description": {"type": "string"}
+                    "regulation": _STRING,
+                    "jurisdiction": _STRING,
+                    "risk_level": _RISK_LEVEL,
+                    "description": _STRING
                 }
             }
         },
@@ -1031,38 +1036,29 @@ COMPANY_RISKS_SCHEMA: dict[str, Any] = {
                     "items": {
                         "type": "object",
                         "properties": {
-                            "case": {"type": "string"},
-                            "status": {"type": "string"},
-                            "potential_impact": {"type": "string"}
+                            "case": _STRING,
+                            "status": _STRING,
+                            "potential_impact": _STRING
                         }
                     }
                 },
-                "past_settlements": {"type": "array", "items": {"type": "string"}},
-                "legal_risk_level": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"]
-                }
+                "past_settlements": _STRING_ARRAY,
+                "legal_risk_level": _RISK_LEVEL
             }
         },
         "key_person_risk": {
             "type": "object",
             "properties": {
-                "risk_level": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"]
-                },
-                "key_individuals": {"type": "array", "items": {"type": "string"}},
-                "succession_plan": {"type": "string"}
+                "risk_level": _RISK_LEVEL,
+                "key_individuals": _STRING_ARRAY,
+                "succession_plan": _STRING
             }
         },
         "customer_concentration": {
             "type": "object",
             "properties": {
-                "top_customer_revenue_pct": {"type": "string"},
-                "concentration_risk_level": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high"]
-                }
+                "top_customer_revenue_pct": _STRING,
+                "concentration_risk_level": _RISK_LEVEL
             }
         },
         "technology_risks": {
@@ -1070,8 +1066,8 @@ COMPANY_RISKS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "risk": {"type": "string"},
-                    "description": {"type": "string"}
+                    "risk": _STRING,
+                    "description": _STRING
                 }
             }
         },
@@ -1080,17 +1076,14 @@ COMPANY_RISKS_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "risk": {"type": "string"},
-                    "description": {"type": "string"}
+                    "risk": _STRING,
+                    "description": _STRING
                 }
             }
         },
-        "supply_chain_risks": {"type": "array", "items": {"type": "string"}},
-        "financial_risks": {"type": "array", "items": {"type": "string"}},
-        "overall_risk_assessment": {
-            "type": "string",
-            "enum": ["low", "medium", "high"]
-        }
+        "supply_chain_risks": _STRING_ARRAY,
+        "financial_risks": _STRING_ARRAY,
+        "overall_risk_assessment": _RISK_LEVEL
     },
     "required": ["company_name"]
 }
@@ -1103,51 +1096,51 @@ COMPANY_RISKS_SCHEMA: dict[str, Any] = {
 COMPANY_ESG_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
-        "company_name": {"type": "string"},
+        "company_name": _STRING,
         "esg_initiatives": {
             "type": "array",
             "items": {
                 "type": "object",
                 "properties": {
-                    "initiative_name": {"type": "string"},
+                    "initiative_name": _STRING,
                     "category": {
                         "type": "string",
                         "enum": ["environmental", "social", "governance"]
                     },
-                    "description": {"type": "string"},
-                    "url": {"type": "string"}
+                    "description": _STRING,
+                    "url": _STRING
                 }
             }
         },
         "sustainability": {
             "type": "object",
             "properties": {
-                "commitments": {"type": "array", "items": {"type": "string"}},
-                "certifications": {"type": "array", "items": {"type": "string"}},
-                "sustainability_report_url": {"type": "string"}
+                "commitments": _STRING_ARRAY,
+                "certifications": _STRING_ARRAY,
+                "sustainability_report_url": _STRING
             }
         },
         "environmental": {
             "type": "object",
             "properties": {
-                "carbon_footprint": {"type": "string"},
-                "renewable_energy_pct": {"type": "string"},
-                "environmental_programs": {"type": "array", "items": {"type": "string"}}
+                "carbon_footprint": _STRING,
+                "renewable_energy_pct": _STRING,
+                "environmental_programs": _STRING_ARRAY
             }
         },
         "social": {
             "type": "object",
             "properties": {
-                "dei_programs": {"type": "array", "items": {"type": "string"}},
-                "community_initiatives": {"type": "array", "items": {"type": "string"}},
-                "labor_practices": {"type": "string"}
+                "dei_programs": _STRING_ARRAY,
+                "community_initiatives": _STRING_ARRAY,
+                "labor_practices": _STRING
             }
         },
         "governance": {
             "type": "object",
             "properties": {
-                "board_diversity": {"type": "string"},
-                "ethics_policies": {"type": "array", "items": {"type": "string"}}
+                "board_diversity": _STRING,
+                "ethics_policies": _STRING_ARRAY
             }
         },
         "controversies": {
@@ -1155,10 +1148,10 @@ COMPANY_ESG_SCHEMA: dict[str, Any] = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "issue": {"type": "string"},
-                    "date": {"type": "string"},
-                    "description": {"type": "string"},
-                    "resolution": {"type": "string"}
+                    "issue": _STRING,
+                    "date": _STRING,
+                    "description": _STRING,
+                    "resolution": _STRING
                 }
             }
         },
@@ -1169,16 +1162,16 @@ COMPANY_ESG_SCHEMA: dict[str, Any] = {
                     "type": "string",
                     "enum": ["positive", "neutral", "negative"]
                 },
-                "notable_recognition": {"type": "array", "items": {"type": "string"}},
-                "notable_criticism": {"type": "array", "items": {"type": "string"}}
+                "notable_recognition": _STRING_ARRAY,
+                "notable_criticism": _STRING_ARRAY
             }
         },
         "esg_rating": {
             "type": "object",
             "properties": {
-                "rating": {"type": "string"},
-                "source": {"type": "string"},
-                "date": {"type": "string"}
+                "rating": _STRING,
+                "source": _STRING,
+                "date": _STRING
             }
         }
     },
@@ -1190,7 +1183,8 @@ COMPANY_ESG_SCHEMA: dict[str, Any] = {
 # SCHEMA REGISTRY
 # =============================================================================
 
-SCHEMAS: dict[str, dict[str, Any]] = {
+# Tool name -> schema definition (serialized below)
+_SCHEMA_DEFINITIONS: dict[str, dict[str, Any]] = {
     # Core company info
     "company_overview": COMPANY_OVERVIEW_SCHEMA,
     "company_products": COMPANY_PRODUCTS_SCHEMA,
@@ -1226,6 +1220,16 @@ SCHEMAS: dict[str, dict[str, Any]] = {
 }
 
 
+# Schemas serialized once (without whitespace) for the structuredOutputSchema request field
+SCHEMAS_JSON: Mapping[str, str] = MappingProxyType(
+    {name: json.dumps(schema, separators=(",", ":")) for name, schema in _SCHEMA_DEFINITIONS.items()}
+)
+
+# Read-only registry of schemas by tool name. The schemas are shared plain
+# dicts (JSON-compatible); the server only sends the pre-serialized SCHEMAS_JSON.
+SCHEMAS: Mapping[str, dict[str, Any]] = MappingProxyType(_SCHEMA_DEFINITIONS)
+
+
 def get_schema(tool_name: str) -> dict[str, Any]:
     """Get JSON schema for a tool by name."""
     schema = SCHEMAS.get(tool_name)
@@ -1236,4 +1240,7 @@ def get_schema(tool_name: str) -> dict[str, Any]:
 
 def get_schema_json(tool_name: str) -> str:
     """Get JSON schema as a JSON string for API requests."""
-    return json.dumps(get_schema(tool_name))
+    schema_json = SCHEMAS_JSON.get(tool_name)
+    if schema_json is None:
+        raise ValueError(f"No schema found for tool: {tool_name}")
+    return schema_json
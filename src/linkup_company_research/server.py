@@ -21,21 +21,25 @@ Tools:
 15. company_strategy - Growth plans, M&A, IPO signals
 16. company_risks - Risk assessment across multiple dimensions
 17. company_esg - ESG initiatives, sustainability, reputation
-18. research_company - Comprehensive research (calls overview, funding, competitors in parallel)
+18. research_company - Comprehensive research (calls selected tools in parallel; overview, funding, competitors by default)
 """
 
+import asyncio
+import importlib.util
 import json
 import os
+import random
 from contextvars import ContextVar
 from typing import Literal, Optional
 
 import httpx
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import Icon
 
+from .cache import TTL_NEWS, cached
 from .prompts import get_prompt
-from .schemas import get_schema
-from .types import OutputFormat, SearchParams, build_search_params
+from .schemas import SCHEMAS_JSON
+from .types import OutputFormat, SearchParams, ToolSpec, build_search_params
 
 # =============================================================================
 # REQUEST-SCOPED API KEY (Thread-safe for multi-user)
@@ -47,6 +51,19 @@ current_api_key: ContextVar[str] = ContextVar("current_api_key", default="")
 # Shared HTTP client for connection pooling
 _http_client: httpx.AsyncClient | None = None
 
+# How long idle pooled connections stay open (seconds). httpx's 5s default would
+# drop the connection opened by warm_http_client() before most first searches.
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 300.0
+
+# HTTP/2 requires the optional `h2` package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Faster JSON encoding and parsing with the optional `orjson` package; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def set_api_key(key: str) -> None:
     """Set API key for current request context (async-safe)."""
@@ -62,18 +79,42 @@ def get_api_key() -> str:
 
 
 async def get_http_client() -> httpx.AsyncClient:
-    """Get shared HTTP client for connection pooling."""
+    """Get shared HTTP client for connection pooling.
+
+    Keep-alive connections are reused across all tool calls; HTTP/2 multiplexes
+    concurrent searches over one connection when the optional `h2` package is installed.
+    """
     global _http_client
     if _http_client is None:
-        _http_client = httpx.AsyncClient(timeout=120.0)
+        _http_client = httpx.AsyncClient(
+            timeout=120.0,
+            http2=HTTP2_AVAILABLE,
+            # Connection counts stay at httpx's defaults (100 total, 20 idle)
+            limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS),
+        )
     return _http_client
 
 
+async def warm_http_client() -> None:
+    """Open a pooled connection to the Linkup API ahead of the first search.
+
+    Pays DNS and TLS setup at startup instead of on the first user request, as
+    long as that request comes within HTTP_KEEPALIVE_EXPIRY_SECONDS (and before
+    Linkup closes the idle connection). Failures are ignored; the first search
+    will simply connect as usual.
+    """
+    client = await get_http_client()
+    try:
+        await client.head(LINKUP_BASE_URL, timeout=10.0)
+    except httpx.HTTPError:
+        pass
+
+
 async def close_http_client() -> None:
     """Close shared HTTP client (call on shutdown)."""
     global _http_client
     if _http_client is not None:
-        await _http_client.close()
+        await _http_client.aclose()
         _http_client = None
 
 
@@ -87,7 +128,12 @@ mcp = FastMCP(
     ],
 )
 
-LINKUP_API_URL = "https://api.linkup.so/v1/search"
+LINKUP_BASE_URL = "https://api.linkup.so"
+LINKUP_API_URL = f"{LINKUP_BASE_URL}/v1/search"
+
+# Retries after Linkup answers 429, and the longest wait between them (seconds)
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_MAX_WAIT_SECONDS = 30.0
 
 
 # =============================================================================
@@ -99,7 +145,7 @@ async def _search(
     query: str,
     depth: Literal["standard", "deep"] = "deep",
     params: Optional[SearchParams] = None,
-    schema: Optional[dict] = None,
+    schema: Optional[str] = None,
 ) -> dict:
     """Execute a Linkup search query with full parameter support.
 
@@ -107,7 +153,7 @@ async def _search(
         query: The search query/prompt
         depth: Search depth - "standard" (fast) or "deep" (comprehensive)
         params: Search parameters (dates, domains, output format, etc.)
-        schema: JSON schema for structured output (required when output_format is STRUCTURED)
+        schema: Serialized JSON schema for structured output (required when output_format is STRUCTURED)
 
     Returns:
         API response dictionary
@@ -125,7 +171,7 @@ async def _search(
         if not schema:
             raise ValueError("Schema required for structured output")
         payload["outputType"] = "structured"
-        payload["structuredOutputSchema"] = json.dumps(schema)
+        payload["structuredOutputSchema"] = schema
     else:
         payload["outputType"] = "sourcedAnswer"
 
@@ -146,38 +192,104 @@ async def _search(
     # Execute request using shared client (connection pooling)
     timeout = 120.0 if depth == "deep" else 60.0
     client = await get_http_client()
-    response = await client.post(
-        LINKUP_API_URL,
-        headers={"Authorization": f"Bearer {get_api_key()}"},
-        json=payload,
-        timeout=timeout,
-    )
+    headers = {"Authorization": f"Bearer {get_api_key()}", "Content-Type": "application/json"}
+    body = _json_dumps(payload)
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        response = await client.post(LINKUP_API_URL, headers=headers, content=body, timeout=timeout)
+        if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+            break
+        await asyncio.sleep(_retry_delay(response, attempt))
     response.raise_for_status()
-    return response.json()
+    return _json_loads(response.content)
 
 
-def _format_response(data: dict, output_format: OutputFormat) -> str:
-    """Format Linkup response based on output type.
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429 response.
+
+    Honors a numeric Retry-After header; otherwise backs off exponentially with
+    full jitter so concurrent searches don't retry in lockstep.
+    """
+    retry_after = response.headers.get("retry-after", "")
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        delay = random.uniform(0, 2 ** attempt)
+    return min(max(delay, 0.0), RATE_LIMIT_MAX_WAIT_SECONDS)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serialize a request body as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(content: bytes) -> dict:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps_indented(data: dict) -> str:
+    """Serialize a structured response as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Search depth and serialized structured-output schema per tool
+_TOOL_SPECS: dict[str, ToolSpec] = {
+    "company_overview": ToolSpec("deep", SCHEMAS_JSON["company_overview"]),
+    "company_products": ToolSpec("standard", SCHEMAS_JSON["company_products"]),
+    "company_business_model": ToolSpec("standard", SCHEMAS_JSON["company_business_model"]),
+    "company_target_market": ToolSpec("standard", SCHEMAS_JSON["company_target_market"]),
+    "company_financials": ToolSpec("deep", SCHEMAS_JSON["company_financials"]),
+    "company_funding": ToolSpec("deep", SCHEMAS_JSON["company_funding"]),
+    "company_leadership": ToolSpec("standard", SCHEMAS_JSON["company_leadership"]),
+    "company_culture": ToolSpec("standard", SCHEMAS_JSON["company_culture"]),
+    "company_clients": ToolSpec("deep", SCHEMAS_JSON["company_clients"]),
+    "company_partnerships": ToolSpec("deep", SCHEMAS_JSON["company_partnerships"]),
+    "company_technology": ToolSpec("deep", SCHEMAS_JSON["company_technology"]),
+    "competitive_landscape": ToolSpec("deep", SCHEMAS_JSON["competitive_landscape"]),
+    "company_market": ToolSpec("deep", SCHEMAS_JSON["company_market"]),
+    "company_news": ToolSpec("standard", SCHEMAS_JSON["company_news"]),
+    "company_strategy": ToolSpec("deep", SCHEMAS_JSON["company_strategy"]),
+    "company_risks": ToolSpec("deep", SCHEMAS_JSON["company_risks"]),
+    "company_esg": ToolSpec("standard", SCHEMAS_JSON["company_esg"]),
+}
+
+
+async def _run_tool(tool: str, params: SearchParams, **prompt_kwargs) -> str:
+    """Render a tool's prompt, search with its depth and schema, and format the result."""
+    spec = _TOOL_SPECS[tool]
+    prompt = get_prompt(tool, **prompt_kwargs)
+    if params.output_format == OutputFormat.STRUCTURED:
+        data = await _search(prompt, depth=spec.depth, params=params, schema=spec.schema_json)
+        return _json_dumps_indented(data)
+    data = await _search(prompt, depth=spec.depth, params=params)
+    return _format_answer(data)
+
+
+def _format_answer(data: dict) -> str:
+    """Format a sourcedAnswer response as the answer followed by its top sources.
 
     Args:
         data: API response dictionary
-        output_format: ANSWER for natural language, STRUCTURED for JSON
 
     Returns:
         Formatted response string
     """
-    if output_format == OutputFormat.STRUCTURED:
-        return json.dumps(data, indent=2)
-    else:
-        result = data.get("answer", "No answer found.")
-        sources = data.get("sources", [])
-        if sources:
-            result += "\n\n**Sources:**\n"
-            for src in sources[:5]:
-                name = src.get("name") or src.get("title", "Source")
-                url = src.get("url", "")
-                result += f"- [{name}]({url})\n"
+    result = data.get("answer", "No answer found.")
+    sources = data.get("sources")
+    if not sources:
         return result
+    lines = [result, "\n\n**Sources:**\n"]
+    lines.extend(
+        f"- [{src.get('name') or src.get('title', 'Source')}]({src.get('url', '')})\n"
+        for src in sources[:5]
+    )
+    return "".join(lines)
 
 
 # =============================================================================
@@ -186,6 +298,7 @@ def _format_response(data: dict, output_format: OutputFormat) -> str:
 
 
 @mcp.tool()
+@cached("company_overview", get_api_key)
 async def company_overview(
     company_name: str,
     output_format: str = "answer",
@@ -209,11 +322,7 @@ async def company_overview(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_overview", company_name=company_name)
-    schema = get_schema("company_overview") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_overview", params, company_name=company_name)
 
 
 # =============================================================================
@@ -222,6 +331,7 @@ async def company_overview(
 
 
 @mcp.tool()
+@cached("company_products", get_api_key)
 async def company_products(
     company_name: str,
     product_name: str = "",
@@ -244,11 +354,7 @@ async def company_products(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_products", company_name=company_name, product_name=product_name)
-    schema = get_schema("company_products") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_products", params, company_name=company_name, product_name=product_name)
 
 
 # =============================================================================
@@ -257,6 +363,7 @@ async def company_products(
 
 
 @mcp.tool()
+@cached("company_business_model", get_api_key)
 async def company_business_model(
     company_name: str,
     output_format: str = "answer",
@@ -277,11 +384,7 @@ async def company_business_model(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_business_model", company_name=company_name)
-    schema = get_schema("company_business_model") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_business_model", params, company_name=company_name)
 
 
 # =============================================================================
@@ -290,6 +393,7 @@ async def company_business_model(
 
 
 @mcp.tool()
+@cached("company_target_market", get_api_key)
 async def company_target_market(
     company_name: str,
     output_format: str = "answer",
@@ -310,11 +414,7 @@ async def company_target_market(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_target_market", company_name=company_name)
-    schema = get_schema("company_target_market") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_target_market", params, company_name=company_name)
 
 
 # =============================================================================
@@ -323,6 +423,7 @@ async def company_target_market(
 
 
 @mcp.tool()
+@cached("company_financials", get_api_key)
 async def company_financials(
     company_name: str,
     output_format: str = "answer",
@@ -349,16 +450,13 @@ async def company_financials(
         max_results=max_results,
     )
 
-    prompt = get_prompt(
+    return await _run_tool(
         "company_financials",
+        params,
         company_name=company_name,
         from_date=from_date,
         to_date=to_date,
     )
-    schema = get_schema("company_financials") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
 
 
 # =============================================================================
@@ -367,6 +465,7 @@ async def company_financials(
 
 
 @mcp.tool()
+@cached("company_funding", get_api_key)
 async def company_funding(
     company_name: str,
     output_format: str = "answer",
@@ -393,16 +492,13 @@ async def company_funding(
         max_results=max_results,
     )
 
-    prompt = get_prompt(
+    return await _run_tool(
         "company_funding",
+        params,
         company_name=company_name,
         from_date=from_date,
         to_date=to_date,
     )
-    schema = get_schema("company_funding") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
 
 
 # =============================================================================
@@ -411,6 +507,7 @@ async def company_funding(
 
 
 @mcp.tool()
+@cached("company_leadership", get_api_key)
 async def company_leadership(
     company_name: str,
     output_format: str = "answer",
@@ -434,11 +531,7 @@ async def company_leadership(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_leadership", company_name=company_name)
-    schema = get_schema("company_leadership") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_leadership", params, company_name=company_name)
 
 
 # =============================================================================
@@ -447,6 +540,7 @@ async def company_leadership(
 
 
 @mcp.tool()
+@cached("company_culture", get_api_key)
 async def company_culture(
     company_name: str,
     output_format: str = "answer",
@@ -467,11 +561,7 @@ async def company_culture(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_culture", company_name=company_name)
-    schema = get_schema("company_culture") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_culture", params, company_name=company_name)
 
 
 # =============================================================================
@@ -480,6 +570,7 @@ async def company_culture(
 
 
 @mcp.tool()
+@cached("company_clients", get_api_key)
 async def company_clients(
     company_name: str,
     output_format: str = "answer",
@@ -500,11 +591,7 @@ async def company_clients(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_clients", company_name=company_name)
-    schema = get_schema("company_clients") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_clients", params, company_name=company_name)
 
 
 # =============================================================================
@@ -513,6 +600,7 @@ async def company_clients(
 
 
 @mcp.tool()
+@cached("company_partnerships", get_api_key)
 async def company_partnerships(
     company_name: str,
     output_format: str = "answer",
@@ -533,11 +621,7 @@ async def company_partnerships(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_partnerships", company_name=company_name)
-    schema = get_schema("company_partnerships") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_partnerships", params, company_name=company_name)
 
 
 # =============================================================================
@@ -546,6 +630,7 @@ async def company_partnerships(
 
 
 @mcp.tool()
+@cached("company_technology", get_api_key)
 async def company_technology(
     company_name: str,
     output_format: str = "answer",
@@ -566,11 +651,7 @@ async def company_technology(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_technology", company_name=company_name)
-    schema = get_schema("company_technology") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_technology", params, company_name=company_name)
 
 
 # =============================================================================
@@ -579,6 +660,7 @@ async def company_technology(
 
 
 @mcp.tool()
+@cached("competitive_landscape", get_api_key)
 async def competitive_landscape(
     company_name: str,
     output_format: str = "answer",
@@ -602,11 +684,7 @@ async def competitive_landscape(
         max_results=max_results,
     )
 
-    prompt = get_prompt("competitive_landscape", company_name=company_name)
-    schema = get_schema("competitive_landscape") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("competitive_landscape", params, company_name=company_name)
 
 
 # =============================================================================
@@ -615,6 +693,7 @@ async def competitive_landscape(
 
 
 @mcp.tool()
+@cached("company_market", get_api_key)
 async def company_market(
     company_name: str,
     output_format: str = "answer",
@@ -635,11 +714,7 @@ async def company_market(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_market", company_name=company_name)
-    schema = get_schema("company_market") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_market", params, company_name=company_name)
 
 
 # =============================================================================
@@ -648,6 +723,7 @@ async def company_market(
 
 
 @mcp.tool()
+@cached("company_news", get_api_key, ttl=TTL_NEWS)
 async def company_news(
     company_name: str,
     topic: str = "",
@@ -682,17 +758,14 @@ async def company_news(
         max_results=max_results,
     )
 
-    prompt = get_prompt(
+    return await _run_tool(
         "company_news",
+        params,
         company_name=company_name,
         topic=topic,
         from_date=from_date,
         to_date=to_date,
     )
-    schema = get_schema("company_news") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
 
 
 # =============================================================================
@@ -701,6 +774,7 @@ async def company_news(
 
 
 @mcp.tool()
+@cached("company_strategy", get_api_key)
 async def company_strategy(
     company_name: str,
     output_format: str = "answer",
@@ -721,11 +795,7 @@ async def company_strategy(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_strategy", company_name=company_name)
-    schema = get_schema("company_strategy") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_strategy", params, company_name=company_name)
 
 
 # =============================================================================
@@ -734,6 +804,7 @@ async def company_strategy(
 
 
 @mcp.tool()
+@cached("company_risks", get_api_key)
 async def company_risks(
     company_name: str,
     output_format: str = "answer",
@@ -754,11 +825,7 @@ async def company_risks(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_risks", company_name=company_name)
-    schema = get_schema("company_risks") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="deep", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_risks", params, company_name=company_name)
 
 
 # =============================================================================
@@ -767,6 +834,7 @@ async def company_risks(
 
 
 @mcp.tool()
+@cached("company_esg", get_api_key)
 async def company_esg(
     company_name: str,
     output_format: str = "answer",
@@ -787,71 +855,110 @@ async def company_esg(
         max_results=max_results,
     )
 
-    prompt = get_prompt("company_esg", company_name=company_name)
-    schema = get_schema("company_esg") if params.output_format == OutputFormat.STRUCTURED else None
-
-    data = await _search(prompt, depth="standard", params=params, schema=schema)
-    return _format_response(data, params.output_format)
+    return await _run_tool("company_esg", params, company_name=company_name)
+
+
+# =============================================================================
+# 18. COMPREHENSIVE RESEARCH (Calls specialized tools in parallel)
+# =============================================================================
+
+# Sections research_company can include (tool name -> (heading, tool)), in report order
+RESEARCH_SECTIONS = {
+    "company_overview": ("Company Overview", company_overview),
+    "company_products": ("Products & Services", company_products),
+    "company_business_model": ("Business Model", company_business_model),
+    "company_target_market": ("Target Market", company_target_market),
+    "company_financials": ("Financials", company_financials),
+    "company_funding": ("Funding & Valuation", company_funding),
+    "company_leadership": ("Leadership", company_leadership),
+    "company_culture": ("Culture & Employer Brand", company_culture),
+    "company_clients": ("Customers & Traction", company_clients),
+    "company_partnerships": ("Partnerships & Ecosystem", company_partnerships),
+    "company_technology": ("Technology & IP", company_technology),
+    "competitive_landscape": ("Competitive Landscape", competitive_landscape),
+    "company_market": ("Market & Industry", company_market),
+    "company_news": ("Recent News", company_news),
+    "company_strategy": ("Strategic Outlook", company_strategy),
+    "company_risks": ("Risk Factors", company_risks),
+    "company_esg": ("ESG & Reputation", company_esg),
+}
+
+# Sections used when the caller doesn't pick any
+DEFAULT_RESEARCH_SECTIONS = ("company_overview", "company_funding", "competitive_landscape")
+
+# Maximum concurrent Linkup searches across all research_company calls
+RESEARCH_CONCURRENCY = 8
+_research_semaphore = asyncio.Semaphore(RESEARCH_CONCURRENCY)
+
+
+def _parse_sections(sections: str) -> list[str]:
+    """Parse comma-separated section names ("all" selects every section)."""
+    names = [s.strip() for s in sections.split(",") if s.strip()]
+    if not names:
+        return list(DEFAULT_RESEARCH_SECTIONS)
+    if names == ["all"]:
+        return list(RESEARCH_SECTIONS)
+    unknown = [name for name in names if name not in RESEARCH_SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown sections: {', '.join(unknown)}. Valid sections: {', '.join(RESEARCH_SECTIONS)}"
+        )
+    return [name for name in RESEARCH_SECTIONS if name in names]
 
 
-# =============================================================================
-# 18. COMPREHENSIVE RESEARCH (Calls 3 tools in parallel)
-# =============================================================================
+async def _run_section(tool_name: str, company_name: str, max_results: int) -> str:
+    """Run one research section, bounded by the shared concurrency limit."""
+    _, tool = RESEARCH_SECTIONS[tool_name]
+    async with _research_semaphore:
+        return await tool(company_name, max_results=max_results)
 
 
 @mcp.tool()
 async def research_company(
     company_name: str,
+    sections: str = "",
     max_results: int = 12,
+    ctx: Optional[Context] = None,
 ) -> str:
     """Comprehensive company research using parallel tool calls.
 
     Use this tool for vague queries like "research [company]" or "tell me about [company]".
-    Calls 3 specialized tools in parallel (overview, funding, competitors) and combines
-    the results into a complete company profile.
+    Calls specialized tools in parallel (by default overview, funding, competitors) and
+    combines the results into a complete company profile.
 
     This is faster than Claude calling 5-6 tools sequentially for general research.
 
     Args:
         company_name: The name of the company to research
+        sections: Optional comma-separated tool names to include (e.g., "company_overview,company_news"),
+            or "all" for all 17 research tools
         max_results: Maximum number of sources per tool (1-50)
     """
-    import asyncio
-
-    # Run 3 specialized tools in parallel
-    overview_task = company_overview(company_name, max_results=max_results)
-    funding_task = company_funding(company_name, max_results=max_results)
-    competitive_task = competitive_landscape(company_name, max_results=max_results)
-
-    results = await asyncio.gather(
-        overview_task,
-        funding_task,
-        competitive_task,
-        return_exceptions=True,
-    )
+    names = _parse_sections(sections)
+    completed = 0
 
-    # Combine results into a single response
-    sections = []
+    async def run(name: str) -> str:
+        # Report each finished section so clients see progress before the full report
+        nonlocal completed
+        try:
+            return await _run_section(name, company_name, max_results)
+        finally:
+            completed += 1
+            if ctx is not None:
+                await ctx.report_progress(completed, len(names), f"{RESEARCH_SECTIONS[name][0]} done")
 
-    # Overview section
-    if not isinstance(results[0], Exception):
-        sections.append(f"## Company Overview\n\n{results[0]}")
-    else:
-        sections.append(f"## Company Overview\n\nUnable to fetch: {results[0]}")
+    results = await asyncio.gather(*(run(name) for name in names), return_exceptions=True)
 
-    # Funding section
-    if not isinstance(results[1], Exception):
-        sections.append(f"## Funding & Valuation\n\n{results[1]}")
-    else:
-        sections.append(f"## Funding & Valuation\n\nUnable to fetch: {results[1]}")
-
-    # Competitive section
-    if not isinstance(results[2], Exception):
-        sections.append(f"## Competitive Landscape\n\n{results[2]}")
-    else:
-        sections.append(f"## Competitive Landscape\n\nUnable to fetch: {results[2]}")
+    # Combine results into a single response
+    report = []
+    for name, result in zip(names, results):
+        heading, _ = RESEARCH_SECTIONS[name]
+        if isinstance(result, Exception):
+            report.append(f"## {heading}\n\nUnable to fetch: {result}")
+        else:
+            report.append(f"## {heading}\n\n{result}")
 
-    return f"# {company_name} - Company Research\n\n" + "\n\n---\n\n".join(sections)
+    return f"# {company_name} - Company Research\n\n" + "\n\n---\n\n".join(report)
 
 
 # =============================================================================
@@ -859,9 +966,30 @@ async def research_company(
 # =============================================================================
 
 
+async def _serve_stdio() -> None:
+    """Serve over stdio, warming the Linkup connection and closing it on exit.
+
+    The shared client is closed here rather than in a FastMCP lifespan: the
+    remote server runs one MCP session per SSE connection, and a lifespan would
+    close the client when any one of them ended.
+    """
+    warm_task = asyncio.create_task(warm_http_client())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        warm_task.cancel()
+        await asyncio.gather(warm_task, return_exceptions=True)
+        await close_http_client()
+
+
 def main():
-    """Run the MCP server."""
-    mcp.run(transport="stdio")
+    """Run the MCP server (on uvloop when the optional package is installed)."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_serve_stdio())
+    else:
+        uvloop.run(_serve_stdio())
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """Type definitions for Linkup Company Research MCP."""
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
 
 class OutputFormat(str, Enum):
@@ -11,7 +12,7 @@ class OutputFormat(str, Enum):
     STRUCTURED = "structured"   # Returns structuredOutput (JSON following schema)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, kw_only=True)
 class SearchParams:
     """Parameters for Linkup API search requests."""
 
@@ -20,8 +21,8 @@ class SearchParams:
     to_date: Optional[str] = None
 
     # Domain filters (up to 50 each)
-    include_domains: Optional[list[str]] = field(default_factory=list)
-    exclude_domains: Optional[list[str]] = field(default_factory=list)
+    include_domains: tuple[str, ...] = ()
+    exclude_domains: tuple[str, ...] = ()
 
     # Result options
     include_images: bool = False
@@ -31,13 +32,64 @@ class SearchParams:
     output_format: OutputFormat = OutputFormat.ANSWER
 
 
-def parse_domain_list(domains: str) -> list[str]:
-    """Parse comma-separated domain string to list (max 50 domains)."""
+@dataclass(frozen=True, slots=True)
+class PromptSection:
+    """One output section of a research prompt (heading plus requested data points)."""
+
+    heading: str
+    lines: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PromptSpec:
+    """Data definition of a research prompt, rendered by prompts.build_template."""
+
+    # Expert persona, e.g. "business analyst researching {company_name}"
+    persona: str
+
+    # Research steps, numbered when rendered
+    steps: tuple[str, ...]
+
+    # Line introducing the requested output
+    task: str
+
+    # Requested output sections
+    sections: tuple[PromptSection, ...]
+
+    # Closing guidance (sourcing rules, scope limits)
+    closing: str
+
+    # Optional filter placeholders appended after the closing guidance
+    filters: tuple[str, ...] = ()
+
+    # Line introducing the research steps
+    steps_header: str = "Execute the following research steps:"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """Static search settings for one research tool."""
+
+    # Linkup search depth
+    depth: Literal["standard", "deep"]
+
+    # Serialized JSON schema sent for structured output
+    schema_json: str
+
+
+@functools.lru_cache(maxsize=256)
+def parse_domain_list(domains: str) -> tuple[str, ...]:
+    """Parse comma-separated domain string to a tuple (max 50 domains).
+
+    Cached, since clients tend to repeat the same domain lists; the result is
+    immutable so cached values can be shared safely.
+    """
     if not domains:
-        return []
-    return [d.strip() for d in domains.split(",") if d.strip()][:50]
+        return ()
+    return tuple([d.strip() for d in domains.split(",") if d.strip()][:50])
 
 
+@functools.lru_cache(maxsize=256)
 def build_search_params(
     output_format: str = "answer",
     from_date: str = "",
@@ -47,7 +99,11 @@ def build_search_params(
     include_images: bool = False,
     max_results: int = 10
 ) -> SearchParams:
-    """Build SearchParams from tool string arguments."""
+    """Build SearchParams from tool string arguments.
+
+    Cached: SearchParams is immutable, so calls with the same arguments (most
+    calls use the tool defaults) share one instance.
+    """
     return SearchParams(
         output_format=OutputFormat(output_format),
         from_date=from_date if from_date else None,
@@ -0,0 +1,53 @@
+"""Tests for the tool response cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from linkup_company_research import server
+from linkup_company_research.cache import normalize_company_name, response_cache
+
+
+@pytest.fixture
+def linkup_requests(monkeypatch):
+    """Route Linkup calls to a mock transport and record their Authorization headers."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["authorization"])
+        return httpx.Response(200, json={"answer": f"answer for {request.headers['authorization']}"})
+
+    response_cache.clear()
+    monkeypatch.setattr(server, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    yield seen
+    response_cache.clear()
+
+
+def call_overview(api_key: str, company_name: str) -> str:
+    async def run() -> str:
+        server.set_api_key(api_key)
+        return await server.company_overview(company_name)
+
+    return asyncio.run(run())
+
+
+def test_same_key_reuses_cached_response(linkup_requests):
+    first = call_overview("KEY_A_1234567890", "Acme Inc.")
+    second = call_overview("KEY_A_1234567890", "ACME corp")
+
+    assert second == first
+    assert linkup_requests == ["Bearer KEY_A_1234567890"]
+
+
+def test_different_keys_do_not_share_responses(linkup_requests):
+    call_overview("KEY_A_1234567890", "Acme Inc.")
+    answer = call_overview("KEY_B_1234567890", "ACME corp")
+
+    assert answer == "answer for Bearer KEY_B_1234567890"
+    assert linkup_requests == ["Bearer KEY_A_1234567890", "Bearer KEY_B_1234567890"]
+
+
+def test_normalize_company_name_strips_case_and_legal_suffix():
+    assert normalize_company_name("  Acme   Inc. ") == "acme"
+    assert normalize_company_name("ACME corp") == "acme"
@@ -0,0 +1,17 @@
+"""Tests for the prompt templates."""
+
+import csv
+from pathlib import Path
+
+from linkup_company_research.prompts import PROMPTS
+
+PROMPTS_CSV = Path(__file__).resolve().parent.parent / "prompts.csv"
+
+
+def test_prompts_csv_matches_templates():
+    with PROMPTS_CSV.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert rows
+    for row in rows:
+        assert row["prompt"] == PROMPTS[row["tool_name"]], row["tool_name"]
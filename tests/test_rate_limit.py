@@ -0,0 +1,167 @@
+"""Tests for the free-tier rate limiters."""
+
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from linkup_company_research import rate_limit
+from linkup_company_research.rate_limit import DAILY_WINDOW_SECONDS, create_rate_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the limiter clock with one the test advances by hand."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def check(limiter, key: str = "1.2.3.4") -> bool:
+    allowed, _ = asyncio.run(limiter.check(key))
+    return allowed
+
+
+@pytest.mark.parametrize("algorithm", ["gcra", "token_bucket"])
+def test_burst_then_refill(clock, algorithm):
+    limiter = create_rate_limiter(algorithm, qps=2, daily=100, max_clients=10)
+
+    assert [check(limiter) for _ in range(3)] == [True, True, False]
+
+    clock.value += 0.5
+    assert check(limiter)
+    assert not check(limiter)
+
+    clock.value += 1.0
+    assert [check(limiter) for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.parametrize("algorithm", ["gcra", "token_bucket"])
+def test_qps_error_message(clock, algorithm):
+    limiter = create_rate_limiter(algorithm, qps=1, daily=100, max_clients=10)
+    check(limiter)
+
+    allowed, error = asyncio.run(limiter.check("1.2.3.4"))
+
+    assert not allowed
+    assert error.startswith("Rate limit exceeded: 1 requests per second")
+
+
+def test_daily_window_resets(clock):
+    limiter = create_rate_limiter("gcra", qps=10, daily=2, max_clients=10)
+    assert check(limiter)
+    clock.value += 1
+    assert check(limiter)
+    clock.value += 1
+
+    allowed, error = asyncio.run(limiter.check("1.2.3.4"))
+    assert not allowed
+    assert error.startswith("Daily limit exceeded: 2 requests per day")
+
+    clock.value += DAILY_WINDOW_SECONDS
+    assert check(limiter)
+
+
+def test_least_recently_seen_client_is_evicted(clock):
+    limiter = create_rate_limiter("token_bucket", qps=1, daily=100, max_clients=2)
+    check(limiter, "a")
+    check(limiter, "b")
+    check(limiter, "c")
+
+    assert len(limiter) == 2
+    # "a" was evicted, so it starts again with a full bucket
+    assert check(limiter, "a")
+    assert not check(limiter, "c")
+
+
+def test_unknown_algorithm_raises():
+    with pytest.raises(ValueError, match="Unknown rate limit algorithm"):
+        create_rate_limiter("leaky", qps=1, daily=1, max_clients=1)
+
+
+def test_redis_rejects_other_algorithms():
+    with pytest.raises(ValueError, match="not available with Redis"):
+        create_rate_limiter("gcra", qps=1, daily=1, max_clients=1, redis_url="redis://localhost:6379")
+
+
+def test_empty_algorithm_defaults_to_gcra():
+    assert isinstance(create_rate_limiter("", qps=1, daily=1, max_clients=1), rate_limit.GCRARateLimiter)
+
+
+class FakeRedis:
+    """Stands in for redis.asyncio.Redis: the rate limit script returns a scripted result."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.result: object = 0
+        self.calls: list[tuple[list, list]] = []
+        self.closed = False
+
+    def register_script(self, script: str):
+        async def run(keys: list, args: list):
+            self.calls.append((keys, args))
+            if isinstance(self.result, Exception):
+                raise self.result
+            return self.result
+
+        return run
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Create a RedisRateLimiter backed by FakeRedis instead of a Redis server."""
+    clients: list[FakeRedis] = []
+
+    def from_url(url: str) -> FakeRedis:
+        clients.append(FakeRedis(url))
+        return clients[-1]
+
+    redis_module = ModuleType("redis")
+    redis_module.asyncio = SimpleNamespace(from_url=from_url)
+    monkeypatch.setitem(sys.modules, "redis", redis_module)
+    monkeypatch.setitem(sys.modules, "redis.asyncio", redis_module.asyncio)
+
+    limiter = create_rate_limiter("", qps=2, daily=50, max_clients=1, redis_url="redis://localhost:6379")
+    return limiter, clients[0]
+
+
+def test_redis_allows_request(fake_redis):
+    limiter, redis = fake_redis
+    redis.result = 0
+
+    assert asyncio.run(limiter.check("1.2.3.4")) == (True, "")
+    assert redis.url == "redis://localhost:6379"
+    assert redis.calls == [(["rl:1.2.3.4"], [2, 50, DAILY_WINDOW_SECONDS])]
+
+
+@pytest.mark.parametrize(
+    ("result", "error_prefix"),
+    [(1, "Rate limit exceeded: 2 requests per second"), (2, "Daily limit exceeded: 50 requests per day")],
+)
+def test_redis_rejects_request(fake_redis, result, error_prefix):
+    limiter, redis = fake_redis
+    redis.result = result
+
+    allowed, error = asyncio.run(limiter.check("1.2.3.4"))
+
+    assert not allowed
+    assert error.startswith(error_prefix)
+
+
+def test_redis_error_fails_open(fake_redis):
+    limiter, redis = fake_redis
+    redis.result = ConnectionError("Redis is down")
+
+    assert asyncio.run(limiter.check("1.2.3.4")) == (True, "")
+
+
+def test_redis_close_releases_client(fake_redis):
+    limiter, redis = fake_redis
+
+    asyncio.run(limiter.close())
+
+    assert redis.closed
@@ -0,0 +1,22 @@
+"""Tests for the structured output schemas."""
+
+import json
+
+import pytest
+
+from linkup_company_research.schemas import SCHEMAS, get_schema, get_schema_json
+
+
+@pytest.mark.parametrize("tool_name", sorted(SCHEMAS))
+def test_get_schema_is_json_serializable(tool_name):
+    assert json.loads(get_schema_json(tool_name)) == json.loads(json.dumps(get_schema(tool_name)))
+
+
+def test_schema_registry_is_read_only():
+    with pytest.raises(TypeError):
+        SCHEMAS["company_overview"] = {}
+
+
+def test_unknown_tool_raises():
+    with pytest.raises(ValueError):
+        get_schema("company_unknown")
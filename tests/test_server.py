@@ -0,0 +1,48 @@
+"""Tests for the tool output formatting."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from linkup_company_research import server
+from linkup_company_research.cache import response_cache
+
+
+@pytest.fixture
+def linkup_response(monkeypatch):
+    """Answer every Linkup call with a fixed structured result and record the request bodies."""
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"company_name": "Acme", "founders": ["Ada"]})
+
+    response_cache.clear()
+    monkeypatch.setattr(server, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    yield bodies
+    response_cache.clear()
+
+
+def test_structured_output_is_indented_json(linkup_response):
+    async def run() -> str:
+        server.set_api_key("KEY_A_1234567890")
+        return await server.company_overview("Acme", output_format="structured")
+
+    result = asyncio.run(run())
+
+    assert result == json.dumps({"company_name": "Acme", "founders": ["Ada"]}, indent=2)
+    assert linkup_response[0]["outputType"] == "structured"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_request_body_is_compact_utf8(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(server, "orjson", None)
+    elif server.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    body = server._json_dumps({"q": "Société Générale", "depth": "deep"})
+
+    assert body == '{"q":"Société Générale","depth":"deep"}'.encode()